@@ -21,6 +21,8 @@ import numpy as np       # Manejo de arreglos
 from scipy import stats  # Herramientas estadísticas
 # Vizualización de datos
 import matplotlib.pyplot as plt
+# Acceso común a los datos de demanda (paquete ``demanda``)
+from demanda import ingesta
 
 
 def correlacion_horas(H_x, H_y, dias_xy, df):
@@ -59,17 +61,10 @@ def correlacion_horas(H_x, H_y, dias_xy, df):
           al coeficiente de Pearson).
 
     '''
-    # Crear arreglo de registro de días seleccionados (índices)
-    # con campo para las dos horas especificadas (columnas)
-    horas_xy = np.empty((dias_xy, 2))
-
-    # Lazo for para almacenar, en el arreglo horas_xy,
-    # los datos de consumo de potencia a las dos tipos de horas
-    # especificadas.
-    for y in range(dias_xy):
-        for x in range(dias_xy):
-            horas_xy[x, 0] = df['MW'].iloc[H_x + 24*x]
-        horas_xy[y, 1] = df['MW'].iloc[H_y + 24*y]
+    # Arreglo de registro de días seleccionados (índices)
+    # con campo para las dos horas especificadas (columnas),
+    # tomado de la matriz (dias, 24) común
+    horas_xy = ingesta.matriz(df, dias_xy)[:, [H_x, H_y]]
 
     # Retornar tupla:
     corr_hrs = (horas_xy, stats.pearsonr(horas_xy[:, 0], horas_xy[:, 1])[0])
@@ -30,6 +30,8 @@ import numpy as np        # Manejo de arreglos
 from scipy import stats   # Herramientas estadísticas
 # Vizualización de datos
 import matplotlib.pyplot as plt
+# Acceso común a los datos de demanda (paquete ``demanda``)
+from demanda import ingesta
 
 # Obtener distribución de mejor ajuste
 from fitter import Fitter
@@ -82,7 +84,7 @@ def energia_semanal(semanas, df):
     # de potencia para la cantidad de horas
     # equivalentes a las semanas requeridas y almacenarlos
     # en el vector datos_semanales.
-    datos_semanales[:horas] = df['MW'].iloc[:horas]
+    datos_semanales[:horas] = ingesta.matriz(df).ravel()[:horas]
     energia = np.trapz(datos_semanales)    # Integrar
 
     # Retornar la energía (MJ)
@@ -124,12 +126,10 @@ def modelo_energia_semanal(semanal, df):
     # a una semana y las columnas cada una de las semanas.
     datos_potencia = np.empty((168, semanal))
 
-    # Lazo for para obtener datos de consumo de potencia
-    # para una cantidad de semanas determinadas:
-    for s in range(semanal):
-        k = s
-        c = s + 1
-        datos_potencia[:, s] = df['MW'].iloc[k*168:c*168]
+    # Datos de consumo de potencia para una cantidad de semanas
+    # determinadas: la serie horaria de la matriz común en bloques de 168
+    serie = ingesta.matriz(df).ravel()
+    datos_potencia[:] = serie[:semanal*168].reshape(semanal, 168).T
 
     # Vector vacío para almacenar la energía consumida
     # del tamaño del número de semanas asignados:
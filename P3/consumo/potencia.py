@@ -10,12 +10,12 @@ y finalmente una gráfica de la misma.
 
 '''
 # Importar librerías a utilizar:
-import pandas as pd      # Manipulación de datos
 import numpy as np       # Manejo de arreglos
 from scipy import stats  # Herramientas estadísticas
 # Vizualización de datos
 import matplotlib.pyplot as plt
-import json              # Importar archivo .json
+# Acceso común a los datos de demanda (paquete ``demanda``)
+from demanda import ingesta
 
 # Obtener distribución de mejor ajuste
 from fitter import Fitter
@@ -45,14 +45,9 @@ def datos_demanda(ruta):
            del año 2019.
 
     '''
-    # -----
     # Transformar la información obtenida a un DataFrame de pandas
-    # -----
-    f = open(ruta, mode='r')   # Abrir archivo para leer
-    demanda_datos = json.loads(f.read())       # dict de python
-    f.close()                                  # Cerrar archivo
-    datos = demanda_datos['data']              # Filtrar llave/key 'data'
-    df = pd.DataFrame(datos)                   # Crear DataFrame
+    # (lectura en memoria compartida con los demás proyectos)
+    df = ingesta.leer(ruta)
 
     # Retornar DataFrame
     return df
@@ -84,14 +79,9 @@ def datos_hora(hora, dias, df):
         - [2] Cantidad de días seleccionados.
 
     '''
-    # Crear vector vacío de la hora específica
-    # del tamaño de los días deseados.
-    hora_x = np.empty(dias)
-
-    # Lazo for para almacenar el consumo de potencia (MW)
-    # a una hora específica a lo largo de los días dados.
-    for d in range(dias):
-        hora_x[d] = df['MW'].iloc[hora + 24*d]
+    # Consumo de potencia (MW) a una hora específica
+    # a lo largo de los días dados (columna de la matriz común)
+    hora_x = ingesta.matriz(df, dias)[:, hora]
 
     # Retorna tupla
     datos_hr = (hora_x, hora, dias)
@@ -1,9 +1,14 @@
+from pathlib import Path
 from setuptools import find_packages, setup
 
+# Paquete común ``demanda`` (no publicado): se instala desde el
+# directorio ``datos/`` de la raíz del repositorio
+DEMANDA = (Path(__file__).resolve().parent.parent / 'datos').as_uri()
+
 setup(
     name='consumo',
     packages=find_packages(include=['consumo']),
-    version='0.0.3',
+    version='0.0.4',
     description='Proyecto 3 de IE0405 - Modelos Probabilísticos de Señales y Sistemas',
     author='Mario Roberto Peralta A.',
     license='MIT',
@@ -12,8 +17,7 @@ setup(
         'scipy',
         'pandas',
         'matplotlib',
-        'requests',
-        'datetime',
+        'demanda @ ' + DEMANDA,
         'fitter',
     ],
 )
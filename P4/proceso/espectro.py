@@ -4,6 +4,8 @@ Por la definición matemática de la densidad espectral de potencia *(psd)*
 calcula la función y gráfica cuando los datos son finitos y discretos.
 
 """
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import signal
 import matplotlib.pyplot as plt
 
@@ -32,10 +34,47 @@ def psd(dia, secuencia_datos):
         Arreglo de muestras de frecuencia.
 
     """
-    datos_dia = secuencia_datos[dia, :]
+    # Periodograma del día dado (ver psd_dias())
+    Sxx, fxx = psd_dias(secuencia_datos[[dia], :])
+    Sxx = Sxx[0]
 
-    # Número de muestras
-    N = len(datos_dia)
+    # Graficar en todo el dominio de la frecuencia
+    plt.plot(fxx, Sxx, 'green')
+    # Etiquetas
+    plt.xlabel('freq. [Hz]')
+    plt.ylabel('PSD')
+    plt.title('Densidad espectral de potencia (psd)')
+    # Guardar gráfica
+    # plt.savefig('../figs/psdplot.svg')
+    # Graficar
+    plt.show()
+    return (Sxx, fxx)
+
+
+def psd_dias(secuencia_datos):
+    """Calcula la psd de todas las funciones muestra a la vez.
+
+    Aplica el periodograma a lo largo del eje de las horas
+    para todos los días en una sola llamada, con la misma
+    definición para muestras finitas que :py:func:`psd`.
+
+    Parameters
+    ----------
+    secuencia_datos : ndarray
+        Arreglo de los datos de consumo de potencia
+        por cada hora durante :math:`n` días.
+
+    Returns
+    -------
+    Sxx : ndarray
+        Densidad espectral de potencia de cada día, de tamaño
+        (dias, frecuencias).
+    fxx : ndarray
+        Arreglo de muestras de frecuencia.
+
+    """
+    # Número de muestras por día
+    N = np.shape(secuencia_datos)[1]
 
     # Duración
     T = N - 1
@@ -43,27 +82,293 @@ def psd(dia, secuencia_datos):
     # Donde N es el número de datos y T la duración de la señal.
     fsxx = N * T
 
-    # psd
-    (fxx, s) = signal.periodogram(datos_dia, fsxx, scaling='density')
+    # psd de cada fila
+    (fxx, s) = signal.periodogram(secuencia_datos, fsxx,
+                                  scaling='density', axis=1)
 
     # Por definición se multiplica delta t cuadrado entre periodo
     # Duración del espectro
-    T_s = len(s) - 1
+    T_s = np.shape(s)[1] - 1
 
     # Diferencia de tiempo al cuadrado
     deltat_2 = pow(N/T_s, 2)
 
     # Aplicar definición de psd para muestras finitas:
     Sxx = (deltat_2/T)*s
+    return (Sxx, fxx)
 
-    # Graficar en todo el dominio de la frecuencia
-    plt.plot(fxx, Sxx, 'green')
-    # Etiquetas
-    plt.xlabel('freq. [Hz]')
-    plt.ylabel('PSD')
-    plt.title('Densidad espectral de potencia (psd)')
-    # Guardar gráfica
-    # plt.savefig('../figs/psdplot.svg')
-    # Graficar
-    plt.show()
+
+def psd_welch(secuencia_datos, nperseg=None, noverlap=None):
+    """Estimación promediada (Welch) de la psd de la serie continua.
+
+    Une todos los días en una única serie y promedia los
+    periodogramas de segmentos traslapados, de modo que los
+    ciclos más largos que un día (e.g. semanales) son visibles.
+    La frecuencia se expresa en ciclos por día.
+
+    Parameters
+    ----------
+    secuencia_datos : ndarray
+        Arreglo de los datos de consumo de potencia
+        por cada hora durante :math:`n` días.
+    nperseg : entero
+        Muestras por segmento. Por defecto cuatro semanas.
+    noverlap : entero
+        Muestras traslapadas entre segmentos. Por defecto
+        la mitad del segmento.
+
+    Returns
+    -------
+    Sxx : ndarray
+        Densidad espectral de potencia promediada.
+    fxx : ndarray
+        Arreglo de frecuencias [ciclos/día].
+
+    """
+    d, h = np.shape(secuencia_datos)
+
+    # Serie continua y segmentos de cuatro semanas por defecto
+    serie = np.reshape(secuencia_datos, d*h)
+    if nperseg is None:
+        nperseg = min(28*h, d*h)
+
+    # Con h muestras por día la frecuencia queda en ciclos/día
+    (fxx, Sxx) = signal.welch(serie, fs=h, nperseg=nperseg,
+                              noverlap=noverlap, scaling='density')
+    return (Sxx, fxx)
+
+
+def guardar_serie(secuencia_datos, ruta):
+    """Guarda la serie continua en un archivo ``.npy``.
+
+    El archivo resultante puede abrirse como arreglo mapeado
+    en memoria (ver :py:func:`psd_flujo`), así que no es
+    necesario cargar todo el historial para analizarlo.
+
+    Parameters
+    ----------
+    secuencia_datos : ndarray
+        Arreglo de los datos de consumo de potencia
+        por cada hora durante :math:`n` días.
+    ruta : cadena
+        Ruta del archivo ``.npy``.
+
+    """
+    np.save(ruta, np.ravel(secuencia_datos))
+
+
+def _espectros_segmentos(segmentos, ventana, fs):
+    """Densidad espectral unilateral de cada segmento (fila).
+
+    Resta la media, aplica la ventana y escala como el
+    periodograma de ``scipy.signal`` con ``scaling='density'``.
+
+    """
+    nperseg = len(ventana)
+    x = (segmentos - np.mean(segmentos, axis=-1, keepdims=True)) * ventana
+    S = np.abs(np.fft.rfft(x, axis=-1))**2 / (fs * np.sum(ventana**2))
+
+    # Unilateral: duplicar todo excepto DC (y Nyquist si nperseg es par)
+    if nperseg % 2:
+        S[..., 1:] *= 2
+    else:
+        S[..., 1:-1] *= 2
+    return S
+
+
+def psd_flujo(fuente, h=24, nperseg=None, noverlap=None, bloque=2**20):
+    """Estimación de Welch de la psd leyendo la serie por bloques.
+
+    Recorre la serie horaria en bloques de ``bloque`` muestras
+    y acumula los espectros de cada segmento completo, conservando
+    entre bloques únicamente las muestras que aún no forman un
+    segmento. La memoria usada es proporcional a ``bloque`` y
+    no a la longitud del historial. El resultado coincide con
+    :py:func:`psd_welch` (ventana de Hann y promedio de segmentos).
+
+    Parameters
+    ----------
+    fuente : cadena o ndarray
+        Ruta de un archivo ``.npy`` (creado, por ejemplo, con
+        :py:func:`guardar_serie`), que se abre mapeado en memoria,
+        o un arreglo unidimensional con la serie continua.
+    h : entero
+        Muestras por día.
+    nperseg : entero
+        Muestras por segmento. Por defecto cuatro semanas.
+    noverlap : entero
+        Muestras traslapadas entre segmentos. Por defecto
+        la mitad del segmento.
+    bloque : entero
+        Muestras leídas en cada iteración.
+
+    Returns
+    -------
+    Sxx : ndarray
+        Densidad espectral de potencia promediada.
+    fxx : ndarray
+        Arreglo de frecuencias [ciclos/día].
+
+    """
+    if isinstance(fuente, str):
+        serie = np.load(fuente, mmap_mode='r')
+    else:
+        serie = np.ravel(fuente)
+
+    if nperseg is None:
+        nperseg = min(28*h, len(serie))
+    if noverlap is None:
+        noverlap = nperseg // 2
+    paso = nperseg - noverlap
+    ventana = signal.get_window('hann', nperseg)
+
+    # Acumuladores del promedio de segmentos
+    suma = np.zeros(nperseg // 2 + 1)
+    k = 0
+    cola = np.empty(0)
+
+    for i in range(0, len(serie), bloque):
+        x = np.concatenate((cola, serie[i:i + bloque]))
+        if len(x) < nperseg:
+            cola = x
+            continue
+
+        # Segmentos completos disponibles en este bloque
+        segmentos = sliding_window_view(x, nperseg)[::paso]
+        suma += np.sum(_espectros_segmentos(segmentos, ventana, h), axis=0)
+        k += len(segmentos)
+
+        # Conservar el inicio del siguiente segmento
+        cola = x[len(segmentos) * paso:]
+
+    if k == 0:
+        raise ValueError('La serie es más corta que un segmento.')
+
+    Sxx = suma / k
+    fxx = np.fft.rfftfreq(nperseg, d=1/h)
     return (Sxx, fxx)
+
+
+def espectrograma(serie, h=24, nperseg=None, noverlap=None):
+    """Espectrograma (psd de tiempo corto) de la serie horaria.
+
+    Calcula la densidad espectral de segmentos consecutivos
+    de la serie continua. Por defecto cada segmento abarca dos
+    semanas y avanza un día, de modo que cada día nuevo aporta
+    un cuadro nuevo. Devuelve un estado que
+    :py:func:`actualizar_espectrograma` extiende con datos nuevos.
+
+    Parameters
+    ----------
+    serie : ndarray
+        Datos de consumo de potencia, ya sea la matriz
+        (dias, horas) o la serie continua.
+    h : entero
+        Muestras por día.
+    nperseg : entero
+        Muestras por segmento. Por defecto dos semanas.
+    noverlap : entero
+        Muestras traslapadas entre segmentos. Por defecto
+        ``nperseg - h`` (un cuadro por día).
+
+    Returns
+    -------
+    estado : dict
+        Llaves:
+
+        - ``'Sxx'`` psd de tamaño (frecuencias, cuadros).
+        - ``'fxx'`` frecuencias [ciclos/día].
+        - ``'txx'`` centro de cada cuadro [días].
+        - ``'cola'`` muestras que aún no completan un cuadro.
+        - ``'inicio'`` posición de ``'cola'`` en la serie.
+        - ``'h'``, ``'nperseg'``, ``'paso'`` configuración.
+
+    """
+    if nperseg is None:
+        nperseg = 14*h
+    if noverlap is None:
+        noverlap = nperseg - h
+
+    estado = {
+        'Sxx': np.empty((nperseg // 2 + 1, 0)),
+        'fxx': np.fft.rfftfreq(nperseg, d=1/h),
+        'txx': np.empty(0),
+        'cola': np.empty(0),
+        'inicio': 0,
+        'h': h,
+        'nperseg': nperseg,
+        'paso': nperseg - noverlap,
+    }
+    return actualizar_espectrograma(estado, serie)
+
+
+def actualizar_espectrograma(estado, nuevos):
+    """Agrega al espectrograma los cuadros de los datos nuevos.
+
+    Solamente calcula los cuadros que se completan con las
+    muestras nuevas (más las pendientes del estado anterior);
+    los cuadros del historial no se recalculan. El estado
+    recibido no se modifica.
+
+    Parameters
+    ----------
+    estado : dict
+        Estado devuelto por :py:func:`espectrograma` o por
+        esta misma función.
+    nuevos : ndarray
+        Datos nuevos de consumo, como matriz (dias, horas)
+        o como serie continua.
+
+    Returns
+    -------
+    estado : dict
+        Estado actualizado (ver :py:func:`espectrograma`).
+
+    """
+    h, nperseg, paso = estado['h'], estado['nperseg'], estado['paso']
+    x = np.concatenate((estado['cola'], np.ravel(nuevos)))
+    estado = dict(estado)
+
+    if len(x) < nperseg:
+        estado['cola'] = x
+        return estado
+
+    # Cuadros completos con los datos disponibles
+    segmentos = sliding_window_view(x, nperseg)[::paso]
+    ventana = signal.get_window('hann', nperseg)
+    S = _espectros_segmentos(segmentos, ventana, h)
+
+    # Centro de cada cuadro en días desde el inicio de la serie
+    k = len(segmentos)
+    t = (estado['inicio'] + np.arange(k)*paso + nperseg/2) / h
+
+    estado['Sxx'] = np.concatenate((estado['Sxx'], S.T), axis=1)
+    estado['txx'] = np.concatenate((estado['txx'], t))
+    estado['cola'] = x[k*paso:]
+    estado['inicio'] += k*paso
+    return estado
+
+
+def grafica_espectrograma(estado):
+    """Grafica el espectrograma.
+
+    Parameters
+    ----------
+    estado : dict
+        Estado devuelto por :py:func:`espectrograma`
+        o :py:func:`actualizar_espectrograma`.
+
+    Returns
+    -------
+    figura : plot
+        Mapa de la psd en función del tiempo y la frecuencia.
+
+    """
+    plt.figure(figsize=(6, 4))
+    plt.pcolormesh(estado['txx'], estado['fxx'], estado['Sxx'],
+                   shading='nearest')
+    # Etiquetas
+    plt.xlabel('Tiempo [días]')
+    plt.ylabel('freq. [ciclos/día]')
+    plt.title('Espectrograma del consumo de potencia')
+    return plt.show()
@@ -5,9 +5,14 @@ Gracias a los conceptos de proceso Estacionario en el Sentido Amplio
 estimar cuan estacionaria es las secuencia aleatoria dada.
 
 """
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import integrate
 # Librería para verificar estacionaridad del proceso.
-from statsmodels.tsa.stattools import adfuller
+from statsmodels.tsa.stattools import adfuller, kpss
+from statsmodels.tools.sm_exceptions import InterpolationWarning
 
 
 def wss(secuencia_datos):
@@ -51,6 +56,82 @@ def wss(secuencia_datos):
         return ('El proceso no es estacionario en el sentido amplio.')
 
 
+def _pruebas(ventana, maxlag):
+    """Pruebas ADF y KPSS sobre una ventana con rezagos acotados.
+
+    Función auxiliar de :py:func:`wss_ventanas`; se define a nivel
+    de módulo para que cada proceso del grupo pueda ejecutarla.
+
+    """
+    ADF, p_adf = adfuller(ventana, maxlag=maxlag, autolag=None)[:2]
+    # Los valores p de KPSS están tabulados en [0.01, 0.1]
+    # y fuera de ese rango se advierte que fueron truncados.
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', InterpolationWarning)
+        KPSS, p_kpss = kpss(ventana, nlags=maxlag)[:2]
+    return (ADF, p_adf, KPSS, p_kpss)
+
+
+def wss_ventanas(secuencia_datos, ventana, paso=1, maxlag=24, procesos=None):
+    """Estacionaridad a lo largo del tiempo en ventanas móviles.
+
+    Une los días en una única serie y aplica las pruebas
+    Augmented Dickey-Fuller (H0: raíz unitaria) y KPSS
+    (H0: estacionaria) a cada ventana de ``ventana`` días
+    que avanza ``paso`` días. El número de rezagos es fijo
+    (``maxlag``), evitando la búsqueda automática de
+    :py:func:`wss` que se vuelve muy lenta en series largas,
+    y las ventanas se reparten entre varios procesos.
+
+    Parameters
+    ----------
+    secuencia_datos : ndarray
+        Matriz de los datos de consumo de potencia
+        por cada hora durante :math:`n` días.
+    ventana : entero
+        Días de cada ventana.
+    paso : entero
+        Días entre el inicio de ventanas consecutivas.
+    maxlag : entero
+        Rezagos (en muestras) usados por ambas pruebas.
+    procesos : entero
+        Cantidad de procesos en paralelo. ``None`` usa todos
+        los procesadores disponibles y 1 ejecuta en serie.
+
+    Returns
+    -------
+    estad : tupla
+        Arreglos con un elemento por ventana. Posiciones:
+
+        - [0] Día inicial de la ventana.
+        - [1] Estadístico ADF.
+        - [2] Valor p de ADF.
+        - [3] Estadístico KPSS.
+        - [4] Valor p de KPSS.
+
+    """
+    d, h = np.shape(secuencia_datos)
+    if not 0 < ventana <= d:
+        raise ValueError('ventana debe estar entre 1 y {} días.'.format(d))
+
+    # Ventanas de la serie continua sin copiar los datos
+    serie = np.reshape(secuencia_datos, d*h)
+    ventanas = sliding_window_view(serie, ventana*h)[::paso*h]
+    inicios = np.arange(len(ventanas)) * paso
+
+    lags = [maxlag] * len(ventanas)
+    if procesos == 1:
+        resultados = list(map(_pruebas, ventanas, lags))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as grupo:
+            resultados = list(grupo.map(_pruebas, ventanas, lags,
+                                        chunksize=8))
+
+    ADF, p_adf, KPSS, p_kpss = np.array(resultados, dtype=float).T
+    estad = (inicios, ADF, p_adf, KPSS, p_kpss)
+    return estad
+
+
 def prom_temporal(dia, secuencia_datos):
     """Dada una función muestra determina el promedio temporal.
 
@@ -58,42 +139,46 @@ def prom_temporal(dia, secuencia_datos):
     ésta está definida. i. e. Sea P una variable aleatoria para el consumo
     de potencia a una hora particular y p una muestra de P
     si la muestra es el día :math:`d` el intervalo serán 24 hrs.
+    La resolución la define la cantidad de columnas de los datos
+    (no necesariamente 24 muestras al día) y es posible pedir
+    varios días a la vez, en cuyo caso se integra a lo largo
+    del eje de las horas en una sola operación.
 
     Parameters
     ----------
-    dia : entero
-        Representa la muestra. No debe ser superior a la candidad
+    dia : entero, arreglo o ``slice``
+        Representa la(s) muestra(s). No debe ser superior a la candidad
         de días de los que dispone la base de datos.
+        ``slice(None)`` selecciona todos los días.
     secuencia_datos : ndarray
         Matriz de los datos de consumo de potencia
         por cada hora durante :math:`n` días.
 
     Returns
     -------
-    p_media : flotante
-        Promedio temporal de la muestra dada.
+    p_media : flotante o ndarray
+        Promedio temporal de la(s) muestra(s) dada(s).
 
     """
-    # Dominio del tiempo donde está definida la muestra:
-    t = np.linspace(0, 23, 24)
-    # Nota: Al se secuencia <t> es discreto.
-
-    # Selccionar de la base de datos el día asignado
+    # Selccionar de la base de datos el(los) día(s) asignado(s)
     s = secuencia_datos[dia, :]
 
-    # Calcular promedio tempotal
-    p_media = (1)/(len(t)) * np.trapz(s, t)
+    # Número de muestras por día (dominio discreto del tiempo)
+    N = np.shape(secuencia_datos)[1]
+
+    # Calcular promedio temporal a lo largo de las horas
+    p_media = (1)/(N) * integrate.trapezoid(s, axis=-1)
 
     # Retornar promedio temporal de la muestra dada.
     return p_media
 
 
-def ergodicidad(secuencia_datos):
-    """Determina si un proceso es ergódico.
+def metricas_ergodicidad(secuencia_datos):
+    """Compara promedios temporales con el promedio estadístico.
 
-    Es decir, un procesos tal que los que los promedios temporales
-    igualan a los estadísticos. Hace uso de la función
-    prom_temp().
+    Calcula el promedio temporal de todas las funciones muestra
+    y la media de cada hora sobre el agregado con reducciones
+    a lo largo de cada eje de la matriz de datos.
 
     Parameters
     ----------
@@ -103,40 +188,52 @@ def ergodicidad(secuencia_datos):
 
     Returns
     -------
-    mensaje : string
-        Un mensaje que indica si el proceso es ergódico o no.
+    metricas : tupla
+        Tupla de flotantes. Posiciones:
+
+        - [0] Media de los promedios temporales.
+        - [1] Media estadística del proceso.
+        - [2] Error relativo entre ambos.
 
     """
-    # Arreglo vacío de días
-    dias, hrs = np.shape(secuencia_datos)
-    prmt_fs = np.empty(dias)
+    # Promedio temporal de todos los días a la vez:
+    m_promt = np.mean(prom_temporal(slice(None), secuencia_datos))
+
+    # Potencia promedio a cada hora y media "promedio" del proceso
+    E_va = np.mean(np.mean(secuencia_datos, axis=0))
 
-    # Se toma la media temporal de cada función muestra:
-    for ds in range(dias):
-        # Llamar función prom_temporal
-        prmt_fs[ds] = prom_temporal(ds, secuencia_datos)
+    # Diferencia relativa entre promedios.
+    error_E = (m_promt - E_va) / E_va
 
-    # Media de los promedios muestras temporales:
-    m_promt = np.mean(prmt_fs)
+    metricas = (m_promt, E_va, error_E)
+    return metricas
 
-    # Media estadística de la variable aleatoria:
-    # Intervalos:
 
-    # Arreglo de potencia promedio
-    pmedia_hr = np.empty(hrs)
+def ergodicidad(secuencia_datos, tol=0.05):
+    """Determina si un proceso es ergódico.
+
+    Es decir, un procesos tal que los que los promedios temporales
+    igualan a los estadísticos. Hace uso de la función
+    :py:func:`metricas_ergodicidad`.
 
-    # Potencia promedio a cada hora
-    for hr in range(hrs):
-        pmedia_hr[hr] = np.mean(secuencia_datos[:, hr])
+    Parameters
+    ----------
+    secuencia_datos : ndarray
+        Matriz de los datos de consumo de potencia
+        por cada hora durante :math:`n` días.
+    tol : flotante
+        Tolerancia del error relativo (5% por defecto).
 
-    # Media "promedio" del proceso
-    E_va = np.mean(pmedia_hr)
+    Returns
+    -------
+    mensaje : string
+        Un mensaje que indica si el proceso es ergódico o no.
 
-    # Diferencia entre promedios.
-    error_E = m_promt - E_va
+    """
+    _, _, error_E = metricas_ergodicidad(secuencia_datos)
 
     # Tolerancia
-    if pow(error_E, 2) <= pow(E_va*0.05, 2):
+    if abs(error_E) <= tol:
         return ('El proceso cumple con ergodicidad')
     else:
         return ('El proceso no cumple con ergodicidad')
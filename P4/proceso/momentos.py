@@ -4,10 +4,120 @@ Para una secuencia aleatoria dada calcula el grado de linealidad
 y disperción gracias al concepto de momentos.
  
 """
+import hashlib
+from collections import OrderedDict
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import stats
+from scipy import special
+from scipy import integrate
 from proceso import proceso
 
+# Almacén de parámetros ya ajustados, indexado por el contenido
+# de la matriz de datos (ver parametros_cache()). Conserva los
+# ``_MAX_PARAMETROS`` ajustes usados más recientemente.
+_parametros = OrderedDict()
+_MAX_PARAMETROS = 8
+
+
+def parametros_cache(pw_dia):
+    """Parámetros genlogistic de cada hora, ajustados una única vez.
+
+    Llama :py:func:`proceso.proceso.parametros` sólo la primera vez
+    que recibe una matriz de datos dada; las siguientes consultas
+    con los mismos datos reutilizan el ajuste almacenado. La llave
+    es una huella (*hash*) del contenido, forma y tipo del arreglo
+    y se conservan únicamente los ajustes usados más recientemente.
+
+    Parameters
+    ----------
+    pw_dia : ndarray
+        Arreglo de los datos de consumo de potencia
+        por cada hora durante :math:`n` días.
+
+    Returns
+    -------
+    parmtrs : ndarray
+        Matriz de tamaño (horas, 3) con los parámetros
+        c | loc | scale de cada hora (sólo lectura; usar
+        ``.copy()`` para modificarla).
+
+    """
+    datos = np.ascontiguousarray(pw_dia)
+    huella = hashlib.sha1(datos.tobytes()).hexdigest()
+    llave = (huella, datos.shape, datos.dtype.str)
+
+    if llave in _parametros:
+        _parametros.move_to_end(llave)
+    else:
+        # Ajuste completo de todas las horas disponibles
+        parmtrs = proceso.parametros(datos, datos.shape[1])
+        parmtrs.flags.writeable = False
+        _parametros[llave] = parmtrs
+        if len(_parametros) > _MAX_PARAMETROS:
+            # Descartar el ajuste usado hace más tiempo
+            _parametros.popitem(last=False)
+
+    return _parametros[llave]
+
+
+def medias(parmtrs):
+    r"""Valor esperado exacto de las distribuciones genlogistic.
+
+    Usa la forma cerrada de la media de la distribución
+    genlogistic, evaluada para todas las horas a la vez:
+
+    .. math:: E[X] = L + S\left(\psi(c) + \gamma\right)
+
+    donde :math:`\psi` es la función digamma y :math:`\gamma`
+    la constante de Euler-Mascheroni (:math:`\gamma = -\psi(1)`).
+
+    Parameters
+    ----------
+    parmtrs : ndarray
+        Matriz de parámetros c | loc | scale (una fila por hora),
+        e.g. la que devuelve :py:func:`parametros_cache`.
+
+    Returns
+    -------
+    E : ndarray
+        Valor esperado de cada hora.
+
+    """
+    c, loc, scale = np.transpose(parmtrs)
+    E = loc + scale * (special.digamma(c) - special.digamma(1))
+    return E
+
+
+def media_numerica(parmtrs):
+    """Valor esperado por integración numérica (método anterior).
+
+    Integra :math:`x f_{X}(x)` con la regla del trapecio
+    en 100 puntos entre los cuantiles 1% y 99% de cada
+    distribución. Trunca las colas, por lo que es sesgado;
+    se conserva únicamente para comparar con :py:func:`medias`.
+
+    Parameters
+    ----------
+    parmtrs : ndarray
+        Matriz de parámetros c | loc | scale (una fila por hora).
+
+    Returns
+    -------
+    E : ndarray
+        Valor esperado aproximado de cada hora.
+
+    """
+    c, loc, scale = (np.transpose(parmtrs)[k][:, np.newaxis]
+                     for k in range(3))
+    X = stats.genlogistic(c, loc, scale)
+
+    # Límites de integración: cuantiles 1% y 99%
+    a, b = X.ppf(0.01), X.ppf(0.99)
+    x = a + (b - a) * np.linspace(0, 1, 100)
+    E = integrate.trapezoid(x * X.pdf(x), x, axis=1)
+    return E
+
 
 def momentos(hr1, hr2, pw_dia):
     """Calcular autocorrelación y autocovarianza.
@@ -35,24 +145,13 @@ def momentos(hr1, hr2, pw_dia):
         - [1] Autocovarianza.
 
     """
-    # Importar parámetros tamaño: (24, 3)
-    parmtrs_datos = proceso.parametros(pw_dia, 24)
-
-    # Extraer parámetros específicos:
-    # Un instante:
-    c1, l1, s1 = parmtrs_datos[hr1, :]
-
-    # El otro instante:
-    c2, l2, s2 = parmtrs_datos[hr2, :]
+    # Importar parámetros tamaño: (24, 3), ajustados una sola vez
+    parmtrs_datos = parametros_cache(pw_dia)
 
     # Obtener datos de los instanes
     Xt_1 = pw_dia[:, hr1]
     Xt_2 = pw_dia[:, hr2]
 
-    # Generar pdf:
-    X1 = stats.genlogistic(c1, l1, s1)
-    X2 = stats.genlogistic(c2, l2, s2)
-
     # Coeficiente de Pearson:
     r, _ = stats.pearsonr(Xt_1, Xt_2)
 
@@ -61,13 +160,8 @@ def momentos(hr1, hr2, pw_dia):
     std2 = np.std(Xt_2)
 
     # Calcular valor Esperado: E[*]
-    # Límites de integración: (-inf, +inf)
-    x1 = np.linspace(X1.ppf(0.01), X1.ppf(0.99), 100)
-    x2 = np.linspace(X2.ppf(0.01), X2.ppf(0.99), 100)
-
-    # Calcular valor esperado por medio de la definición de integral
-    E1 = np.trapz(x1 * X1.pdf(x1), x1)
-    E2 = np.trapz(x2 * X2.pdf(x2), x2)
+    # Forma cerrada de la distribución genlogistic
+    E1, E2 = medias(parmtrs_datos[[hr1, hr2], :])
 
     # Autocovarianza:
     CXX = r * std1 * std2
@@ -77,3 +171,127 @@ def momentos(hr1, hr2, pw_dia):
 
     a_CR = (RXX, CXX)
     return a_CR
+
+
+def momentos_horas(pw_dia):
+    """Autocorrelación y autocovarianza entre todos los pares de horas.
+
+    Versión en lote de :py:func:`momentos`: en lugar de un par
+    de horas devuelve las matrices completas, donde la entrada
+    :math:`(i, j)` corresponde a ``momentos(i, j, pw_dia)``.
+    Los parámetros se toman de :py:func:`parametros_cache`.
+
+    Parameters
+    ----------
+    pw_dia : ndarray
+        Arreglo de los datos de consumo de potencia
+        por cada hora durante :math:`n` días.
+
+    Returns
+    -------
+    a_CR : tupla
+        Tupla de matrices de tamaño (horas, horas). Posiciones:
+
+        - [0] autocorrelación.
+        - [1] Autocovarianza.
+
+    """
+    parmtrs_datos = parametros_cache(pw_dia)
+
+    # Valor esperado exacto de cada hora
+    E = medias(parmtrs_datos)
+
+    # Autocovarianza: coeficiente de Pearson por las desviaciones
+    # estándar equivale a la covarianza poblacional.
+    CXX = np.cov(pw_dia, rowvar=False, bias=True)
+
+    # Autocorrelación:
+    RXX = CXX + np.outer(E, E)
+
+    a_CR = (RXX, CXX)
+    return a_CR
+
+
+def momentos_rezago(pw_dia, dias=1):
+    r"""Matrices completas :math:`R_{XX}(t_{1}, t_{2})` y :math:`C_{XX}(t_{1}, t_{2})`.
+
+    Une los días en una única serie continua y toma como función
+    muestra cada ventana de ``dias`` días consecutivos que inicia
+    en la hora cero de algún día, de modo que :math:`t_{1}` y
+    :math:`t_{2}` pueden estar separados hasta ``dias * horas - 1``
+    horas. Los valores esperados son los de la forma cerrada de
+    cada hora (:py:func:`medias`), igual que en :py:func:`momentos_horas`,
+    y la autocovarianza se calcula en una sola operación matricial:
+
+    .. math:: R_{XX}(t_{1}, t_{2}) = C_{XX}(t_{1}, t_{2}) + E[X(t_{1})]E[X(t_{2})]
+
+    Parameters
+    ----------
+    pw_dia : ndarray
+        Arreglo de los datos de consumo de potencia
+        por cada hora durante :math:`n` días.
+    dias : entero
+        Días consecutivos que abarca cada función muestra.
+        Debe ser menor a :math:`n`.
+
+    Returns
+    -------
+    a_CR : tupla
+        Tupla de matrices de tamaño
+        (dias * horas, dias * horas). Posiciones:
+
+        - [0] autocorrelación.
+        - [1] Autocovarianza.
+
+    """
+    d, h = np.shape(pw_dia)
+    if not 0 < dias < d:
+        raise ValueError('dias debe estar entre 1 y {}.'.format(d - 1))
+
+    # Funciones muestra: ventanas de dias*h horas que avanzan un día
+    serie = np.reshape(pw_dia, d*h)
+    muestras = sliding_window_view(serie, dias*h)[::h]
+
+    # Valor esperado exacto de cada instante según su hora del día
+    E = np.tile(medias(parametros_cache(pw_dia)), dias)
+
+    # Autocovarianza en una sola operación:
+    CXX = np.cov(muestras, rowvar=False, bias=True)
+
+    # Autocorrelación:
+    RXX = CXX + np.outer(E, E)
+
+    a_CR = (RXX, CXX)
+    return a_CR
+
+
+def promedio_rezago(MXX):
+    r"""Promedia una matriz de momentos según el rezago :math:`\tau`.
+
+    Para un proceso *wss* los momentos dependen únicamente de
+    :math:`\tau = t_{2} - t_{1}`, así que se promedian las
+    diagonales de la matriz dada (por ejemplo la que devuelve
+    :py:func:`momentos_rezago`) para obtener :math:`R_{XX}(\tau)`
+    o :math:`C_{XX}(\tau)`.
+
+    Parameters
+    ----------
+    MXX : ndarray
+        Matriz cuadrada de autocorrelación o autocovarianza.
+
+    Returns
+    -------
+    M_tau : ndarray
+        Momento promedio para cada rezago
+        :math:`\tau = 0, 1, ..., n - 1` horas.
+
+    """
+    n = len(MXX)
+    # Rezago de cada entrada de la matriz
+    t1, t2 = np.indices((n, n))
+    tau = np.abs(t2 - t1).ravel()
+
+    # Suma y conteo por diagonal en una sola pasada
+    M_tau = (np.bincount(tau, weights=np.ravel(MXX), minlength=n)
+             / np.bincount(tau, minlength=n))
+    return M_tau
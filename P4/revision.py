@@ -11,6 +11,9 @@ Secciones:
 """
 from proceso import proceso, momentos, estacionaridad, espectro
 import numpy as np
+import os
+import tempfile
+import time
 
 # -----
 # SECCIÓN A: Función de densidad de probabilidad
@@ -90,15 +93,36 @@ print('La probabilidad (en porcentaje) es: {:0.4%}.'.format(prbblty))
 # 4. Autocorrelación
 
 # Verificar la autocorrelación entre las horas: 7:00am y 11:00am
-Rxx, _ = momentos.momentos(7, 11, secuencia_datos)
+# (los parámetros se ajustan una sola vez y quedan almacenados)
+Rxx, Cxx = momentos.momentos(7, 11, secuencia_datos)
 print('La autocorrelación Rxx es: {:0.4f}'.format(Rxx))
 
 # 5. Autocovarianza
 
 # Verificar la autocovarianza entre las horas: 7:00am y 11:00am
-_, Cxx = momentos.momentos(7, 11, secuencia_datos)
 print('La autocovarianza Cxx es: {:0.4f}'.format(Cxx))
 
+# Matrices para todos los pares de horas en una sola llamada
+RXX, CXX = momentos.momentos_horas(secuencia_datos)
+print('Rxx(7, 11) a partir de la matriz: {:0.4f}'.format(RXX[7, 11]))
+
+# Comparación del valor esperado: forma cerrada vs. integración numérica
+parmtrs_cache = momentos.parametros_cache(secuencia_datos)
+t_0 = time.perf_counter()
+E_exacta = momentos.medias(parmtrs_cache)
+t_1 = time.perf_counter()
+E_numerica = momentos.media_numerica(parmtrs_cache)
+t_2 = time.perf_counter()
+print('Medias exactas: {:0.2e} s, numéricas: {:0.2e} s'
+      .format(t_1 - t_0, t_2 - t_1))
+print('Error relativo máximo de la integración numérica: {:0.4%}'
+      .format(np.max(np.abs(E_numerica - E_exacta) / E_exacta)))
+
+# Estructura de rezagos a lo largo de una semana (168 horas)
+RXX_s, CXX_s = momentos.momentos_rezago(secuencia_datos, dias=7)
+Cxx_tau = momentos.promedio_rezago(CXX_s)
+print('Autocovarianza con rezago de un día: {:0.4f}'.format(Cxx_tau[24]))
+
 # -----
 # SECCIÓN C: Estacionaridad
 # -----
@@ -109,6 +133,14 @@ print('La autocovarianza Cxx es: {:0.4f}'.format(Cxx))
 est_s_a = estacionaridad.wss(secuencia_datos)
 print(est_s_a)
 
+# Estacionaridad en ventanas móviles de 30 días que avanzan 7 días.
+# Este script no está protegido con ``if __name__ == '__main__'``,
+# por lo que aquí se usa un único proceso.
+dia_0, ADF, p_adf, KPSS, p_kpss = estacionaridad.wss_ventanas(
+    secuencia_datos, 30, paso=7, procesos=1)
+print('Ventanas estacionarias según ADF: {} de {}'
+      .format(np.sum(p_adf <= 0.05), len(dia_0)))
+
 # 7. Promedio temporal
 # Calcular promedio temporal en el día 2019-05-15.
 prom_t_fs = estacionaridad.prom_temporal(134, secuencia_datos)
@@ -119,6 +151,8 @@ print('El promedio temporal el día dado es {:0.4f} [MW]'.format(prom_t_fs))
 # con un 5% de tolerancia:
 erg = estacionaridad.ergodicidad(secuencia_datos)
 print(erg)
+m_promt, E_va, error_E = estacionaridad.metricas_ergodicidad(secuencia_datos)
+print('Error relativo entre promedios: {:0.4%}'.format(error_E))
 
 # -----
 # SECCIÓN D: Características espectrales
@@ -142,3 +176,26 @@ error = (P_promf - P_promt) / (P_promt)
 
 # Mostrar error en porcentaje
 print('El error de potencia promedio es: {:0.4%}'.format(error))
+
+# psd de todos los días en una sola llamada y estimación de Welch
+# de la serie continua (frecuencia en ciclos por día)
+Sxx_dias, _ = espectro.psd_dias(secuencia_datos)
+Sxx_w, fxx_w = espectro.psd_welch(secuencia_datos)
+print('Frecuencia dominante (ciclos/día): {:0.4f}'
+      .format(fxx_w[1:][np.argmax(Sxx_w[1:])]))
+
+# Misma estimación leyendo la serie por bloques desde un archivo
+# mapeado en memoria (memoria acotada sin importar el historial)
+with tempfile.TemporaryDirectory() as carpeta:
+    ruta_serie = os.path.join(carpeta, 'serie_consumohr.npy')
+    espectro.guardar_serie(secuencia_datos, ruta_serie)
+    Sxx_f, fxx_f = espectro.psd_flujo(ruta_serie, bloque=24*7)
+print('Diferencia máxima con Welch: {:0.4e}'
+      .format(np.max(np.abs(Sxx_f - Sxx_w))))
+
+# 10. Espectrograma
+# Historial hasta el día 300 y actualización con los días restantes
+# (únicamente se calculan los cuadros nuevos)
+estado = espectro.espectrograma(secuencia_datos[:300])
+estado = espectro.actualizar_espectrograma(estado, secuencia_datos[300:])
+espectro.grafica_espectrograma(estado)
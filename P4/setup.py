@@ -1,18 +1,22 @@
+from pathlib import Path
 from setuptools import find_packages, setup
 
+# Paquete común ``demanda`` (no publicado): se instala desde el
+# directorio ``datos/`` de la raíz del repositorio
+DEMANDA = (Path(__file__).resolve().parent.parent / 'datos').as_uri()
+
 setup(
     name='proceso',
     packages=find_packages(include=['proceso']),
-    version='0.0.3',
+    version='0.0.4',
     description='Proyecto 4 de IE0405 - Modelos Probabilísticos de Señales y Sistemas',
     author='Mario R. Peralta A',
     license='MIT',
     install_requires=[
         'numpy',
         'scipy',
-        'requests',
         'matplotlib',
         'pandas',
-        'datetime',
+        'demanda @ ' + DEMANDA,
     ],
 )
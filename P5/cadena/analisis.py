@@ -13,6 +13,8 @@ exponencialmente distribuidos con parámetro :math:`\nu`,
 luego se cumple que el tiempo medio de servicio es :math:`\frac{1}{\nu}`.
 
 """
+import numpy as np
+import pandas as pd
 
 
 def llegada(media_lam):
@@ -90,6 +92,174 @@ def servicio(media_nu):
     return nu
 
 
+def _conteo(conteo, t_llegadas, ancho):
+    """Suma al conteo por intervalo las llegadas de un bloque."""
+    parcial = np.bincount((t_llegadas // ancho).astype(int))
+    if len(parcial) > len(conteo):
+        conteo = np.pad(conteo, (0, len(parcial) - len(conteo)))
+    conteo[:len(parcial)] += parcial
+    return conteo
+
+
+def llegada_variable(t_llegadas, ancho=3600, periodo=None, duracion=None,
+                     columna='llegada', bloque=10**6):
+    r"""Intensidad de llegada variable en el tiempo :math:`\lambda(t)`.
+
+    Para un proceso de Poisson no homogéneo estima una intensidad
+    constante por intervalos de ``ancho`` segundos: el número de
+    llegadas en cada intervalo entre el tiempo observado en él.
+    Con ``periodo`` (e.g. 86400 s para un perfil diario por hora)
+    los intervalos se pliegan módulo el periodo, de modo que cada
+    fase acumula las llegadas y el tiempo observado de todos los ciclos.
+    Si ``t_llegadas`` es la ruta de un archivo CSV, éste se lee en
+    bloques de ``bloque`` filas (ver :py:func:`estimacion_flujo`)
+    y sólo se conservan los conteos por intervalo.
+
+    Parameters
+    ----------
+    t_llegadas : vector o str
+        Instantes de llegada (segundos desde el inicio) o ruta
+        del archivo CSV de clientes.
+    ancho : flotante
+        Ancho de cada intervalo en segundos.
+    periodo : flotante, opcional
+        Periodo del perfil, múltiplo de ``ancho``.
+    duracion : flotante, opcional
+        Tiempo observado; por defecto la última llegada.
+    columna : str
+        Columna de instantes de llegada del archivo CSV.
+    bloque : entero
+        Filas leídas por bloque del archivo CSV.
+
+    Returns
+    -------
+    lam_t : tupla
+        Posiciones:
+
+        - [0] inicio de cada intervalo (segundos).
+        - [1] intensidad de llegada :math:`\lambda` en cada intervalo.
+
+    Examples
+    --------
+    >>> from cadena import analisis
+    >>> inicios, lam_t = analisis.llegada_variable('clientes.csv')
+
+    """
+    if isinstance(t_llegadas, str):
+        bloques = (trozo[columna].to_numpy(dtype=float) for trozo in
+                   pd.read_csv(t_llegadas, usecols=[columna], chunksize=bloque))
+    else:
+        bloques = [np.asarray(t_llegadas, dtype=float)]
+
+    # Llegadas por intervalo, acumuladas bloque a bloque
+    conteo = np.zeros(0, dtype=int)
+    T = 0.0
+    for t in bloques:
+        if duracion is None:
+            T = max(T, t.max(initial=0.0))
+        else:
+            t = t[t < duracion]
+        conteo = _conteo(conteo, t, ancho)
+    if duracion is not None:
+        T = duracion
+
+    # Intervalos consecutivos y tiempo observado en cada uno; una
+    # llegada justo en T (múltiplo de ancho) cuenta en el último
+    n_int = max(int(np.ceil(T / ancho)), 1)
+    conteo = np.pad(conteo, (0, max(n_int - len(conteo), 0)))
+    conteo[n_int - 1] += conteo[n_int:].sum()
+    conteo = conteo[:n_int]
+    observado = np.clip(T - np.arange(n_int) * ancho, 0, ancho)
+
+    if periodo is not None:
+        fases = int(round(periodo / ancho))
+        if not np.isclose(fases * ancho, periodo):
+            raise ValueError('periodo debe ser múltiplo de ancho.')
+        fase = np.arange(n_int) % fases
+        conteo = np.bincount(fase, weights=conteo, minlength=fases)
+        observado = np.bincount(fase, weights=observado, minlength=fases)
+        n_int = fases
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        lam = np.where(observado > 0, conteo / observado, 0.0)
+
+    lam_t = (np.arange(n_int) * ancho, lam)
+    return lam_t
+
+
+def _combinar(a, b):
+    """Combina momentos (n, media, M2) de dos bloques (Chan et al.)."""
+    n_a, media_a, M2_a = a
+    n_b, media_b, M2_b = b
+    n = n_a + n_b
+    delta = media_b - media_a
+    media = media_a + delta * n_b / n
+    M2 = M2_a + M2_b + delta**2 * n_a * n_b / n
+    return (n, media, M2)
+
+
+def estimacion_flujo(ruta, columnas=('intervalo', 'servicio'), bloque=10**6):
+    r"""Estimación en flujo de los parámetros de llegada y servicio.
+
+    Lee el registro de clientes en bloques de ``bloque`` filas con
+    ``pd.read_csv(chunksize=...)`` y mantiene, por columna, el
+    conteo, la media y la suma de cuadrados de desviaciones
+    :math:`M_{2}`. Los momentos de cada bloque se calculan
+    vectorizados y se combinan con la actualización de
+    Welford/Chan, así la memoria no depende del tamaño del archivo:
+
+    .. math:: \delta = \bar{x}_{B} - \bar{x}_{A}, \quad M_{2} = M_{2,A} + M_{2,B} + \delta^{2}\frac{n_{A}n_{B}}{n}
+
+    Como diagnóstico del ajuste exponencial se reporta el
+    coeficiente de variación :math:`\frac{\sigma}{\mu}`,
+    que vale uno para la distribución exponencial.
+
+    Parameters
+    ----------
+    ruta : str
+        Ruta del archivo CSV de clientes.
+    columnas : tupla de str
+        Columnas de intervalos entre llegadas y de tiempos de servicio.
+    bloque : entero
+        Filas leídas por bloque.
+
+    Returns
+    -------
+    est : tupla
+        Posiciones:
+
+        - [0] parámetro de intensidad de llegada :math:`\lambda`.
+        - [1] parámetro de servicio :math:`\nu`.
+        - [2] DataFrame con índice ``columnas`` y columnas ``n``,
+          ``media``, ``varianza`` y ``cv``.
+
+    Examples
+    --------
+    >>> from cadena import analisis
+    >>> lam_llegada, nu, estad = analisis.estimacion_flujo('clientes.csv')
+    >>> print('Parámetro de intensidad de llegada: {:0.4f}'.format(lam_llegada))
+    Parámetro de intensidad de llegada: 0.0350
+
+    """
+    columnas = list(columnas)
+    momentos = (0, np.zeros(len(columnas)), np.zeros(len(columnas)))
+    for trozo in pd.read_csv(ruta, usecols=columnas, chunksize=bloque):
+        x = trozo[columnas].to_numpy(dtype=float)
+        media = x.mean(axis=0)
+        momentos = _combinar(
+            momentos, (len(x), media, ((x - media)**2).sum(axis=0)))
+
+    n, media, M2 = momentos
+    if n < 2:
+        raise ValueError('Se requieren al menos dos clientes.')
+    varianza = M2 / (n - 1)
+    estad = pd.DataFrame({'n': n, 'media': media, 'varianza': varianza,
+                          'cv': np.sqrt(varianza) / media}, index=columnas)
+
+    est = (llegada(media[0]), servicio(media[1]), estad)
+    return est
+
+
 def parametros(lam_llegada, nu, i, s):
     r"""Permanencia y probabilidades de transición de :math:`i`.
 
@@ -103,47 +273,48 @@ def parametros(lam_llegada, nu, i, s):
 
     .. math:: f_X(x) = \Omega e^{-\Omega x}
 
+    Con :math:`\min(i, s)` servidores ocupados, los tres casos
+    (estado inicial, servidores disponibles y saturados) son
+
+    .. math:: \Omega_{i} = \lambda + \min(i, s)\nu, \quad p = \frac{\lambda}{\Omega_{i}}, \quad q = \frac{\min(i, s)\nu}{\Omega_{i}}
+
+    Todos los argumentos aceptan arreglos que se combinan por
+    *broadcasting*, e.g. un vector de estados y una columna de
+    servidores devuelve una matriz (servidores, estados) lista
+    para :py:func:`cadena.servicio.estados`.
+
     Parameters
     ----------
-    lam_llegada : flotante
+    lam_llegada : flotante o ndarray
         El parámetro de llegada.
-    nu : flotante
+    nu : flotante o ndarray
         El parámetro nu representa lo que demora el cliente
         en su trámite una vez que es atendido.
-    i : entero
+    i : entero o ndarray
         Estado específico :math:`i`.
-    s : entero
+    s : entero o ndarray
         Número de servidores.
 
     Returns
     -------
-    Omega : flotante
+    Omega : flotante o ndarray
         Parámetro de permanencia (recíproco del tiempo de espera promedio).
-    p : flotante
+    p : flotante o ndarray
         Probabilidad de la máquina salir del
         estado :math:`i` cambiar al estado :math:`i + 1`.
-    q : flotante
+    q : flotante o ndarray
         Probabilidad de la máquina salir del
         estado :math:`i` cambiar al estado :math:`i - 1`.
 
     Examples
     --------
     >>> from cadena import analisis
-    >>> import numpy as
+    >>> import numpy as np
     >>> # Parámetros de los primeros seis estados
     >>> i = 5        # Estado del sistema al tiempo t
     >>> n = i + 1    # Número total de estados hasta instante t
-    >>> # Arreglo de los tres parámetros
-    >>> parmtrs = np.empty((n, 3))
-    >>> # Para cada estado solicitado y sistema M/M/1
-    >>> for c in range(n):
-    >>>     parmtrs[c, :] = analisis.parametros(lam_llegada, nu, c, s=1)
-    >>> # Extraer vectores de parámetros encontrados:
-    >>> # Parámetro de permanencia
-    >>> omega = parmtrs[:, 0]
-    >>> # Probabilidades de transición
-    >>> p = parmtrs[:, 1]
-    >>> q = parmtrs[:, 2]
+    >>> # Para todos los estados solicitados y sistema M/M/1
+    >>> omega, p, q = analisis.parametros(lam_llegada, nu, np.arange(n), s=1)
     >>> # Mostrar resultados:
     >>> print('Parámetro de intensidad de llegada: {:0.4f}'.format(lam_llegada))
     >>> print('Parámetro de Intensidad de servicio: {:0.4f}'.format(nu))
@@ -157,20 +328,16 @@ def parametros(lam_llegada, nu, i, s):
     q:  [0.         0.58218424 0.58218424 0.58218424 0.58218424 0.58218424]
 
     """
-    # Caso: Estado inicial
-    if i == 0:
-        omega = lam_llegada
-        p = 1
-        q = 0
-    # Caso: i >= 1 y servidores saturados
-    elif i >= s:
-        omega = lam_llegada + s*nu
-        p = lam_llegada / omega
-        q = s*nu / omega
-    # Caso: i >= 1 y servidores disponibles
-    else:
-        omega = lam_llegada + i*nu
-        p = lam_llegada / omega
-        q = i*nu / omega
+    lam_llegada, nu, i, s = np.broadcast_arrays(
+        np.asarray(lam_llegada, dtype=float), np.asarray(nu, dtype=float),
+        np.asarray(i, dtype=int), np.asarray(s, dtype=int))
+
+    # Servidores ocupados: ninguno en el estado inicial,
+    # i si hay servidores disponibles y s si están saturados
+    ocupados = np.minimum(i, s)
+
+    omega = lam_llegada + ocupados*nu
+    p = lam_llegada / omega
+    q = ocupados*nu / omega
 
-    return (omega, p, q)
+    return (omega[()], p[()], q[()])
@@ -0,0 +1,151 @@
+r"""Éste módulo evalúa escenarios de dimensionamiento en lote.
+
+Para rangos de los parámetros :math:`\lambda`, :math:`\nu`,
+:math:`L_{q}`, :math:`P` y :math:`s` arma la malla completa
+(producto cartesiano) de escenarios y evalúa sobre ella las
+funciones :py:func:`cadena.dimensionamiento.t_servicio`,
+:py:func:`cadena.dimensionamiento.servidores` y
+:py:func:`cadena.dimensionamiento.tiempo` de forma vectorizada.
+Se ejecuta desde la terminal (la salida ``.parquet`` requiere
+el extra ``parquet``: ``pip install .[parquet]``):
+
+.. code:: bash
+
+    python -m cadena.barrido --lam 0.01:0.04:31 --nu 0.0488 \
+        --Lq 1,3,5 --P 90,95,99 --s 1:6 --salida escenarios.csv
+
+"""
+import argparse
+import numpy as np
+import pandas as pd
+from . import dimensionamiento
+
+
+def rango(texto, tipo=float):
+    """Convierte un rango de la línea de comandos en un arreglo.
+
+    Acepta valores separados por comas (``1,3,5``), un rango
+    ``inicio:fin`` de enteros (inclusivo) o ``inicio:fin:pasos``
+    de valores equiespaciados.
+
+    Parameters
+    ----------
+    texto : str
+        Rango en cualquiera de los formatos anteriores.
+    tipo : type
+        Tipo de los valores (``float`` o ``int``).
+
+    Returns
+    -------
+    valores : ndarray
+        Valores del rango.
+
+    Examples
+    --------
+    >>> from cadena import barrido
+    >>> barrido.rango('0.01:0.04:4')
+    array([0.01, 0.02, 0.03, 0.04])
+    >>> barrido.rango('1:4', int)
+    array([1, 2, 3, 4])
+
+    """
+    if ':' not in texto:
+        return np.array([tipo(v) for v in texto.split(',')])
+    partes = texto.split(':')
+    if len(partes) == 2:
+        return np.arange(int(partes[0]), int(partes[1]) + 1)
+    inicio, fin, pasos = float(partes[0]), float(partes[1]), int(partes[2])
+    return np.linspace(inicio, fin, pasos).astype(tipo)
+
+
+def barrido(lam, nu, Lq, P, s):
+    """Evalúa el dimensionamiento para todas las combinaciones.
+
+    Cada función se evalúa únicamente sobre los ejes de los que
+    depende (e.g. :py:func:`cadena.dimensionamiento.servidores`
+    no depende de :math:`s`) y el resultado se expande por
+    *broadcasting* a la malla completa.
+
+    Parameters
+    ----------
+    lam : vector
+        Parámetros de llegada.
+    nu : vector
+        Parámetros de servicio actuales.
+    Lq : vector de enteros
+        Espacios en fila del criterio.
+    P : vector
+        Porcentajes de tiempo del criterio (:math:`0 < P < 100`).
+    s : vector de enteros
+        Servidores disponibles.
+
+    Returns
+    -------
+    tabla : DataFrame
+        Una fila por escenario con columnas ``lam``, ``nu``, ``Lq``,
+        ``P``, ``s``, ``t_servicio``, ``servidores`` y ``tiempo``.
+
+    Examples
+    --------
+    >>> from cadena import barrido
+    >>> tabla = barrido.barrido([0.035], [0.0488], [5], [99], [3])
+    >>> print(tabla.iloc[0].tolist())
+    [0.035, 0.0488, 5.0, 99.0, 3.0, 15.0, 2.0, 21.0]
+
+    """
+    ejes = [np.asarray(lam, dtype=float), np.asarray(nu, dtype=float),
+            np.asarray(Lq, dtype=int), np.asarray(P, dtype=float),
+            np.asarray(s, dtype=int)]
+    # Cada parámetro sobre su propio eje de la malla
+    lam, nu, Lq, P, s = [
+        x.reshape([-1 if j == i else 1 for j in range(5)])
+        for i, x in enumerate(ejes)]
+    forma = tuple(len(x) for x in ejes)
+
+    resultados = {
+        't_servicio': dimensionamiento.t_servicio(lam, Lq, P),
+        'servidores': dimensionamiento.servidores(lam, nu, Lq, P),
+        'tiempo': dimensionamiento.tiempo(lam, nu, Lq, P, s),
+    }
+
+    tabla = pd.DataFrame({
+        nombre: np.broadcast_to(x, forma).ravel()
+        for nombre, x in [('lam', lam), ('nu', nu), ('Lq', Lq), ('P', P),
+                          ('s', s)] + list(resultados.items())})
+    # Columnas enteras compactas
+    for nombre in ['Lq', 's', 't_servicio', 'servidores', 'tiempo']:
+        tabla[nombre] = tabla[nombre].astype('int32')
+    return tabla
+
+
+def main(argumentos=None):
+    """Punto de entrada de ``python -m cadena.barrido``."""
+    analizador = argparse.ArgumentParser(
+        prog='python -m cadena.barrido',
+        description='Barrido de escenarios de dimensionamiento M/M/s.')
+    analizador.add_argument('--lam', required=True,
+                            help='Parámetros de llegada, e.g. 0.01:0.04:31')
+    analizador.add_argument('--nu', required=True,
+                            help='Parámetros de servicio, e.g. 0.0488')
+    analizador.add_argument('--Lq', default='5',
+                            help='Espacios en fila, e.g. 1,3,5 o 1:10')
+    analizador.add_argument('--P', default='99',
+                            help='Porcentajes de tiempo, e.g. 90,95,99')
+    analizador.add_argument('--s', default='1:5',
+                            help='Servidores disponibles, e.g. 1:10')
+    analizador.add_argument('--salida', default='escenarios.csv',
+                            help='Archivo de resultados (.csv o .parquet; '
+                                 'éste requiere pip install cadena[parquet])')
+    args = analizador.parse_args(argumentos)
+
+    tabla = barrido(rango(args.lam), rango(args.nu), rango(args.Lq, int),
+                    rango(args.P), rango(args.s, int))
+    if args.salida.endswith('.parquet'):
+        tabla.to_parquet(args.salida, index=False)
+    else:
+        tabla.to_csv(args.salida, index=False)
+    print('{} escenarios guardados en {}'.format(len(tabla), args.salida))
+
+
+if __name__ == '__main__':
+    main()
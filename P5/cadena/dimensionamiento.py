@@ -18,9 +18,9 @@ el criterio, puesto que solamente el 90% del tiempo fue cumplida la condición,
 y se requería el 95%.
 
 """
+from functools import lru_cache    # Evaluaciones repetidas de (r, s)
 import numpy as np                  # Manipulación de datos
-import math                         # Usar factorial
-from scipy.optimize import fsolve   # Resolver ecuaciones
+import pandas as pd                 # Tablas de escenarios
 
 
 def t_servicio(lam, Lq, P):
@@ -30,16 +30,23 @@ def t_servicio(lam, Lq, P):
     de calidad especificado y el parámetro de intensidad de
     arribo del sistema actual para encontrar
     una taza de servicio "v" tal que cumpliría el criterio
-    de calidad de servicio.
+    de calidad de servicio. La condición
+    :math:`\left(\frac{\lambda}{v}\right)^{L_{q} + 2} = 1 - \frac{P}{100}`
+    tiene solución exacta
+
+    .. math:: v = \lambda \left(1 - \frac{P}{100}\right)^{-\frac{1}{L_{q} + 2}}
+
+    por lo que no es necesario un método numérico. Acepta arreglos
+    de ``lam``, ``Lq`` y ``P`` (se combinan por *broadcasting*).
 
     Parameters
     ----------
-    lam: flotante
+    lam: flotante o ndarray
         Parámetro de llegada del sistema.
-    Lq : entero
+    Lq : entero o ndarray
         Número de espacios por debajo del cual se desea que los
         clientes esperen en fila antes de recibir el servicio.
-    P : entero
+    P : entero o ndarray
         Porcentaje de tiempo mínimo requerido en que se desea que la
         situacción de exceso (espera de más de Lq espacios antes de
         ser atendido) se presente únicamente un
@@ -48,7 +55,7 @@ def t_servicio(lam, Lq, P):
 
     Returns
     -------
-    t : entero
+    t : entero o ndarray
         tiempo promedio de servicio (segundos), dedicado a cada cliente
         para que el servidor único cumpla con el criterio de calidad.
         Nota:
@@ -70,9 +77,14 @@ def t_servicio(lam, Lq, P):
     El servidor debe demorar 15 segundos como máximo en asistir a cada cliente.
 
     """
+    lam = np.asarray(lam, dtype=float)
+    P = np.asarray(P, dtype=float)
+    if np.any((P <= 0) | (P >= 100)):
+        raise ValueError('P debe cumplir 0 < P < 100.')
+
     # Estados para el diseño, asumiendo M/M/1:
-    L = Lq + 1        # Número de clientes en el sistema
-    e = L + 1         # Situación de exceso
+    L = np.asarray(Lq) + 1    # Número de clientes en el sistema
+    e = L + 1                 # Situación de exceso
 
     # Porcentaje de tiempo, como máximo, en situación de exceso
     p = 1 - (P/100)
@@ -82,21 +94,127 @@ def t_servicio(lam, Lq, P):
     # Luego sea v = s * nu
     #
     # Se asumen un v si la cantidad de servidores fuera s = 1
-    # Aplicar definición para M/M/1
-    def f(v):
-        y = (lam/v)**(e) - p
-        return y
-
-    # Resolver ecuación para "v"
-    # suposición inicial positivo cerca de cero: v0 = 0.001
-    v = fsolve(f, 0.0001)
+    # Despejar "v" de la definición para M/M/1: (lam/v)**e = p
+    v = lam / p**(1 / e)
 
     # Obtener el entero próximo superior del inveso del parámetro "v"
-    t = np.ceil(1 / v[0]).astype('int')
+    t = np.ceil(1 / v).astype('int')
 
     # Retornar tiempo promedio de servicio (segundos) que cada cliente
     # debe recibir para cumplir criterio.
-    return t
+    return t[()]
+
+
+def tabla_t_servicio(lam, Lq, P):
+    """Tabla de escenarios de :py:func:`t_servicio`.
+
+    Evalúa el tiempo de servicio para todas las combinaciones
+    de los valores dados en una sola operación vectorizada.
+
+    Parameters
+    ----------
+    lam : vector
+        Parámetros de llegada a evaluar.
+    Lq : vector
+        Longitudes de fila a evaluar.
+    P : vector
+        Porcentajes de tiempo a evaluar.
+
+    Returns
+    -------
+    tabla : DataFrame
+        Una fila por combinación, con columnas
+        ``lam``, ``Lq``, ``P`` y ``t``.
+
+    Examples
+    --------
+    >>> from cadena import dimensionamiento
+    >>> tabla = dimensionamiento.tabla_t_servicio(
+    >>>     [0.030, 0.035, 0.040], [3, 5], [95, 99])
+    >>> print(tabla.head(2))
+        lam  Lq     P   t
+    0  0.03   3  95.0  19
+    1  0.03   3  99.0  14
+
+    """
+    lam, Lq, P = np.meshgrid(np.asarray(lam, dtype=float),
+                             np.asarray(Lq, dtype=int),
+                             np.asarray(P, dtype=float), indexing='ij')
+    tabla = pd.DataFrame({'lam': lam.ravel(), 'Lq': Lq.ravel(),
+                          'P': P.ravel()})
+    tabla['t'] = t_servicio(tabla['lam'].to_numpy(),
+                            tabla['Lq'].to_numpy(), tabla['P'].to_numpy())
+    return tabla
+
+
+def _log_factorial(n):
+    """Arreglo de :math:`\\ln(k!)` para :math:`k = 0, 1, ..., n`."""
+    return np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, n + 1)))))
+
+
+def erlang_b(r, s):
+    r"""Probabilidad de bloqueo de Erlang B, vectorizada.
+
+    Usa la recursión estable
+
+    .. math:: B(k) = \frac{r B(k - 1)}{k + r B(k - 1)}, \quad B(0) = 1
+
+    sin factoriales ni potencias y acotada en :math:`[0, 1]`, por
+    lo que no se desborda para cientos de servidores aun con
+    cargas pequeñas. Acepta arreglos de ``r`` y ``s``
+    (se combinan por *broadcasting*).
+
+    Parameters
+    ----------
+    r : flotante o ndarray
+        Relación de parámetros de intensidad :math:`\lambda / \nu`.
+    s : entero o ndarray
+        Número de servidores.
+
+    Returns
+    -------
+    B : flotante o ndarray
+        Probabilidad de bloqueo del sistema M/M/s/s.
+
+    """
+    r, s = np.broadcast_arrays(np.asarray(r, dtype=float),
+                               np.asarray(s, dtype=int))
+    B = np.ones(r.shape)
+    for k in range(1, np.max(s, initial=0) + 1):
+        B = np.where(k <= s, r * B / (k + r * B), B)
+    return B[()]
+
+
+def erlang_c(r, s):
+    r"""Probabilidad de espera de Erlang C, vectorizada.
+
+    Probabilidad de que un cliente encuentre los :math:`s`
+    servidores ocupados en un sistema M/M/s, a partir de
+    :py:func:`erlang_b`:
+
+    .. math:: C = \frac{s B}{s - r \left(1 - B \right)}
+
+    Si :math:`r \geqslant s` no hay estado estable y devuelve 1.
+
+    Parameters
+    ----------
+    r : flotante o ndarray
+        Relación de parámetros de intensidad :math:`\lambda / \nu`.
+    s : entero o ndarray
+        Número de servidores.
+
+    Returns
+    -------
+    C : flotante o ndarray
+        Probabilidad de que todos los servidores estén ocupados.
+
+    """
+    r, s = np.broadcast_arrays(np.asarray(r, dtype=float),
+                               np.asarray(s, dtype=int))
+    B = erlang_b(r, s)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        C = np.where(r < s, s * B / (s - r * (1 - B)), 1.0)
+    return C[()]
 
 
 def probabilidades(r, L, s):
@@ -105,52 +223,58 @@ def probabilidades(r, L, s):
     Función auxiliar. Determina la probabidad
     acumulada a partir del estado :math:`i`, o sea
     la probabilidad de que la cola tenga una
-    longitud al menos de :math:`L`.
+    longitud al menos de :math:`L`. Se calcula a partir
+    de Erlang C (:py:func:`erlang_c`): si :math:`L + 1 \geqslant s`
+
+    .. math:: P(N \geqslant L + 1) = C \left(\frac{r}{s}\right)^{L + 1 - s}
+
+    y si no, el complemento de los primeros estados se obtiene
+    con sumas acumuladas de :math:`r^{k}/k!` en escala logarítmica.
+    Acepta arreglos de ``r``, ``L`` y ``s``.
 
     Parameters
     ----------
-    r : flotante
+    r : flotante o ndarray
         Relación de parámetros de intensidad. Se debe cumplir que:
         :math:`\frac{\rho}{s} < 1`
-    L : entero
+    L : entero o ndarray
         Longitud promedio de la cola del sistema.
-    s : entero
+    s : entero o ndarray
         Número de servidores.
 
     Returns
     -------
-    probabilidad : flotante
+    probabilidad : flotante o ndarray
         Probabilidad acumulada de al menos :math:`L + 1`
 
     """
-    kes = []         # Inicializar sumatoria de k's
-    # Probabilidad de estado inicial: i = 0
-    for k in range(s):
-        stadok = r**k / math.factorial(k)
-        # Operar sumatoria
-        kes.append(stadok)
-    alfa = sum(kes)
-    beta = (s * r**s) / ((math.factorial(s))*(1-((r)/(s))))
-    serie = alfa + beta
-    phi0 = 1 / serie
-
-    # Calcular probabilidad asumiendo estados
-    # mutuamente excluyentes (o sea no pueden ocurrir
-    # multiples estados a la vez)
-    #
-    # Probabilidad de cola como mucho L (inclusivo).
-    phiL = []
-    for i in range(L + 1):
-        if i < s:
-            phii = ((pow(r, i)) / (math.factorial(i))) * phi0
-            phiL.append(phii)
-        # Todos servidores ocupados
-        else:
-            phis = (((s**s) * (pow(r/s, i))) / (math.factorial(s))) * phi0
-            phiL.append(phis)
-    # Tomar complemento: Probabilidad de almenos L + 1 (inclusivo)
-    probabilidad = 1 - sum(phiL)
-    return probabilidad
+    r, L, s = np.broadcast_arrays(np.asarray(r, dtype=float),
+                                  np.asarray(L, dtype=int),
+                                  np.asarray(s, dtype=int))
+    C = np.asarray(erlang_c(r, s))
+
+    # Cola más larga que los servidores: serie geométrica. La base
+    # se acota a 1 y el exponente a 0 para no desbordar en los
+    # casos que se descartan (r >= s) o se reemplazan abajo (L + 1 < s)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        geometrica = C * np.minimum(r / s, 1.0)**np.maximum(L + 1 - s, 0)
+        probabilidad = np.where(r < s, geometrica, 1.0)
+
+    # Cola más corta que los servidores:
+    # P(N <= L) = (1 - C) * sum_{k<=L} r^k/k! / sum_{k<s} r^k/k!
+    corta = (L + 1 < s) & (r < s)
+    if np.any(corta):
+        rc, Lc, sc = r[corta], L[corta], s[corta]
+        k = np.arange(np.max(sc))
+        with np.errstate(divide='ignore'):
+            log_r = np.log(rc)[:, np.newaxis]
+        log_t = np.where(k == 0, 0.0, k * log_r) - _log_factorial(k[-1])
+        log_F = np.logaddexp.accumulate(log_t, axis=1)
+        fila = np.arange(len(rc))
+        razon = np.exp(log_F[fila, Lc] - log_F[fila, sc - 1])
+        probabilidad[corta] = 1 - (1 - C[corta]) * razon
+
+    return probabilidad[()]
 
 
 def servidores(lam_llegada, nu, Lq, P):
@@ -159,17 +283,23 @@ def servidores(lam_llegada, nu, Lq, P):
     Considera el criterio de calidad especificado y los parámetros
     de arribo y servicio del sistema actual para encontrar
     la cantidad de servidores mínimos :math:`s` que lo cumplirían.
+    Recorre :math:`s = 1, 2, ...` sin límite superior actualizando
+    en cada paso el estado de la recursión de Erlang
+    (ver :py:func:`erlang_b`) en lugar de recalcular
+    :py:func:`probabilidades` desde cero. Acepta arreglos de
+    parámetros (se combinan por *broadcasting*) y dimensiona
+    todas las colas en una sola llamada.
 
     Parameters
     ----------
-    lam_llegada: flotante
+    lam_llegada: flotante o ndarray
         Parámetro de llegada del sistema.
-    nu : flotante
+    nu : flotante o ndarray
         Parámetro de servicio actual del sistema.
-    Lq : entero
+    Lq : entero o ndarray
         Número de espacios por debajo del cual se desea que los
         clientes esperen en fila antes de recibir el servicio.
-    P : entero
+    P : entero o ndarray
         Porcentaje de tiempo mínimo requerido en que se desea que la
         situacción de exceso (espera de más de Lq espacios antes de
         ser atendido) se presente únicamente un
@@ -178,11 +308,11 @@ def servidores(lam_llegada, nu, Lq, P):
 
     Returns
     -------
-    s : entero
+    s : entero o ndarray
         Cantidad de servidores mínimos que cumplen con el requerimiento.
-        Advertencia: Para :math:`s \geqslant 10` cumputacionalmente es muy demandante
-        por tanto se sugiere un modelo de infinitos servidores :math:`s` cuya
-        probabilidad de estados converga en una distribución de Poisson.
+        Es -1 si ninguna cantidad de servidores lo cumple, lo que
+        ocurre cuando aun con infinitos servidores (distribución
+        de Poisson) la probabilidad de exceso supera la cota.
 
     Examples
     --------
@@ -195,26 +325,72 @@ def servidores(lam_llegada, nu, Lq, P):
     >>> # M/M/s: Aumento de servidores
     >>> ss = dimensionamiento.servidores(lam_llegada, nu, Lq, P)
     >>> print('Cantidad de servidores mínimos requeridos: ', ss)
-    Cantidad de servidores mínimos requeridos: 5
+    Cantidad de servidores mínimos requeridos: 2
 
     """
-    s = 1                     # Inicializar cantidad de servidores
+    lam_llegada, nu, Lq, P = np.broadcast_arrays(
+        np.asarray(lam_llegada, dtype=float), np.asarray(nu, dtype=float),
+        np.asarray(Lq, dtype=int), np.asarray(P, dtype=float))
+    if np.any((P <= 0) | (P >= 100)):
+        raise ValueError('P debe cumplir 0 < P < 100.')
+
     Pt = 1 - (P/100)          # Cota máxima de porcentaje de tiempo
     r = lam_llegada / nu      # Relación de parámetros de intensidad
+    if not np.all(np.isfinite(r)):
+        raise ValueError('Se requiere nu > 0 para dimensionar.')
     # Longitud de cola promedio del sistema i = L
     L = np.ceil(Lq + r).astype('int')
 
-    # Iterar hasta cumplir criterio:
-    while s < 10:
-        # Llamar función de probabilidad acumulada
-        probabilidad = probabilidades(r, L, s)
-        # Verificar criterio
-        if probabilidad < Pt:
-            # Condición se satisface
-            break
-        # No cumple todavía
-        s += 1
-    return s
+    s_min = np.zeros(r.shape, dtype=int)
+
+    # Estado de la recursión para las colas aún sin dimensionar:
+    # 1/B(s), ln(r^(s-1)/(s-1)!), ln(sum_{k<s} r^k/k!)
+    # y ln(sum_{k<=L} r^k/k!) una vez que s - 1 alcanza L.
+    activos = np.flatnonzero(np.ones(r.shape, dtype=bool))
+    r, L, Pt = r.ravel(), L.ravel(), Pt.ravel()
+    inv_B = np.ones(r.shape)
+    log_t = np.zeros(r.shape)
+    log_F = np.zeros(r.shape)
+    log_F_L = np.zeros(r.shape)
+
+    s = 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        while len(activos):
+            s += 1
+            # Avanzar un servidor la recursión de Erlang
+            inv_B = 1 + (s / r) * inv_B
+            B = 1 / inv_B
+            if s > 1:
+                log_t = log_t + np.log(r) - np.log(s - 1)
+                log_F = np.logaddexp(log_F, log_t)
+            log_F_L = np.where(L == s - 1, log_F, log_F_L)
+
+            # Probabilidad de al menos L + 1 clientes en el sistema
+            C = s * B / (s - r * (1 - B))
+            # Base y exponente acotados para no desbordar en los
+            # casos que descarta np.where (r >= s o L + 1 < s)
+            geometrica = C * np.minimum(r / s, 1.0)**np.maximum(L + 1 - s, 0)
+            probabilidad = np.where(
+                L + 1 >= s, geometrica,
+                1 - (1 - C) * np.exp(log_F_L - log_F))
+            probabilidad = np.where(r < s, probabilidad, 1.0)
+
+            # Verificar criterio. Con s - 1 >= L y s -> inf la probabilidad
+            # tiende a la cola de Poisson 1 - F(L) e^(-r); si ésta no está
+            # por debajo de la cota ningún s cumple el criterio.
+            cumple = probabilidad < Pt
+            imposible = (~cumple & (s - 1 >= L)
+                         & (1 - np.exp(log_F_L - r) >= Pt))
+            s_min.flat[activos[cumple]] = s
+            s_min.flat[activos[imposible]] = -1
+
+            # Retirar las colas ya dimensionadas
+            sigue = ~(cumple | imposible)
+            activos, r, L, Pt = activos[sigue], r[sigue], L[sigue], Pt[sigue]
+            inv_B, log_t = inv_B[sigue], log_t[sigue]
+            log_F, log_F_L = log_F[sigue], log_F_L[sigue]
+
+    return s_min[()]
 
 
 def tiempo(lam_llegada, nu, Lq, P, s):
@@ -226,31 +402,35 @@ def tiempo(lam_llegada, nu, Lq, P, s):
     para encontrar el tiempo máximo que deba tardar, cada servidor
     del sistema, en asistir clientes.
 
+    Todos los parámetros aceptan arreglos que se combinan
+    por *broadcasting*.
+
     Parameters
     ----------
-    lam : flotante
+    lam : flotante o ndarray
         Parámetro de llegada del sistema.
-    nu : flotante
+    nu : flotante o ndarray
         Parámetro de intensidad de servicio actual del sistema.
-    Lq : entero
+    Lq : entero o ndarray
         Número de espacios por debajo del cual se desea que los
         clientes esperen en fila antes de recibir el servicio.
-    P : entero
+    P : entero o ndarray
         Porcentaje de tiempo mínimo requerido en que se desea que la
         situacción de exceso (espera de más de Lq espacios antes de
         ser atendido) se presente únicamente un
         :math:`\left(1 - \frac{P}{100} \right)` del tiempo.
         Advertencia: :math:`0 < P < 100`.
-    s : entero
+    s : entero o ndarray
         Número de servidores de los que se dispone.
         Advertencia :math:`s \geqslant 2`.
 
     Returns
     -------
-    t : entero
+    t : entero o ndarray
         Tiempo (segundos) promedio necesario de servicio a cierto
         cliente (una vez que es atendido) que satisfase
         el criterio dado cuando hay múltiples servidores.
+        Es -1 si la fórmula no tiene solución (e.g. :math:`r \geq s`).
 
     Examples
     --------
@@ -267,9 +447,13 @@ def tiempo(lam_llegada, nu, Lq, P, s):
     >>>     ('Si se cuenta con {} servidores unicamente, cada\n'.format(s)),
     >>>     ('servidor debería tardar {} seg. en asistir algún cliente'.format(t)))
     Si se cuenta con 3 servidores unicamente, cada
-    servidor debería tardar 20 seg. en asistir algún cliente.
+    servidor debería tardar 21 seg. en asistir algún cliente.
 
     """
+    lam_llegada, nu, Lq, P, s = np.broadcast_arrays(
+        np.asarray(lam_llegada, dtype=float), np.asarray(nu, dtype=float),
+        np.asarray(Lq, dtype=int), np.asarray(P, dtype=float),
+        np.asarray(s, dtype=int))
     Pt = 100 - P              # Cota máxima de porcentaje de tiempo
     r = lam_llegada / nu      # Relación de parámetros de intensidad
     # Longitud de cola promedio del sistema i = L
@@ -279,20 +463,129 @@ def tiempo(lam_llegada, nu, Lq, P, s):
     pro = 100 * probabilidad      # Tomar procentaje
     # Relación de probabilidades
     D = pro / Pt
-    if D <= 1:
-        # Ya se cuenta con la intensidad de servicio necesaria
-        # Tomar recíproco entero superior
-        t = np.ceil(1 / nu).astype('int')
-        # Retornar segundos necesarios
-        return t
-    else:
-        # Probabilidad de cola como mucho L (inclusivo).
-        phiL = 1 - probabilidad
+    # Probabilidad de cola como mucho L (inclusivo).
+    phiL = 1 - probabilidad
+    with np.errstate(divide='ignore', invalid='ignore'):
         # Constante de proporción
         E = (phiL+D-1) / (D*phiL)
-        # Nueva intensidad por servidor
-        nu_s = E * nu
-        # Tomar recíproco entero superior
-        t = np.ceil(1 / nu_s).astype('int')
-        # Retornar segundos necesarios
-        return t
+        # Nueva intensidad por servidor: la actual si
+        # ya se cuenta con la intensidad de servicio necesaria
+        nu_s = np.where(D <= 1, nu, E * nu)
+        # Tomar recíproco entero superior (-1 si no hay solución)
+        t = np.where(np.isfinite(nu_s) & (nu_s > 0),
+                     np.ceil(1 / nu_s), -1).astype('int')
+
+    # Retornar segundos necesarios
+    return t[()]
+
+
+@lru_cache(maxsize=None)
+def _fila_media(r, s_max):
+    """Clientes promedio en fila M/M/s para s = 1, ..., s_max (memoizada)."""
+    s = np.arange(1, s_max + 1)
+    with np.errstate(divide='ignore'):
+        Lq = np.where(r < s, erlang_c(r, s) * r / (s - r), np.inf)
+    Lq.flags.writeable = False
+    return Lq
+
+
+def programacion(lam_horas, nu, Lq, P, costo_servidor, costo_espera,
+                 costo_cambio=0, s_max=None):
+    r"""Programación de servidores por hora de costo mínimo.
+
+    Para un perfil de intensidades de llegada :math:`\lambda_{h}`
+    (e.g. por hora del día, ver :py:func:`cadena.analisis.llegada_variable`)
+    elige los servidores :math:`s_{h}` de cada periodo que minimizan
+
+    .. math:: \sum_{h} \left(c_{s} s_{h} + c_{w} L_{q}(r_{h}, s_{h})\right) + c_{c} \sum_{h} |s_{h} - s_{h-1}|
+
+    sujeto a :math:`s_{h}` mayor o igual que lo que requiere el
+    criterio de calidad (:py:func:`servidores`). :math:`L_{q}(r, s)`
+    es el número promedio de clientes en fila M/M/s obtenido con
+    :py:func:`erlang_c`; las evaluaciones de cada :math:`(r, s)`
+    se memorizan, de modo que los periodos con la misma carga
+    (o llamadas repetidas) no se recalculan. El costo de cambio
+    acopla los periodos y se resuelve por programación dinámica.
+
+    Parameters
+    ----------
+    lam_horas : vector
+        Parámetro de llegada de cada periodo.
+    nu : flotante
+        Parámetro de servicio de cada servidor.
+    Lq : entero
+        Espacios en fila del criterio (ver :py:func:`servidores`).
+    P : flotante
+        Porcentaje de tiempo del criterio (:math:`0 < P < 100`).
+    costo_servidor : flotante
+        Costo de un servidor durante un periodo.
+    costo_espera : flotante
+        Costo de un cliente en fila durante un periodo.
+    costo_cambio : flotante
+        Costo de agregar o retirar un servidor entre periodos.
+    s_max : entero, opcional
+        Servidores máximos considerados, al menos el mayor mínimo
+        requerido; por defecto diez más que éste.
+
+    Returns
+    -------
+    prog : tupla
+        Posiciones:
+
+        - [0] DataFrame por periodo con columnas ``lam``, ``s_min``,
+          ``s``, ``Lq`` y ``costo``.
+        - [1] costo total (incluye los cambios de servidores).
+
+    Examples
+    --------
+    >>> from cadena import dimensionamiento
+    >>> import numpy as np
+    >>> lam_horas = 0.035 * (1 + 0.5*np.sin(np.pi*np.arange(12)/12))
+    >>> tabla, costo = dimensionamiento.programacion(
+    >>>     lam_horas, 0.0488, 5, 99, costo_servidor=10, costo_espera=4,
+    >>>     costo_cambio=3)
+    >>> print(tabla['s'].tolist())
+    [2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]
+
+    """
+    lam_horas = np.asarray(lam_horas, dtype=float)
+    s_min = np.atleast_1d(servidores(lam_horas, nu, Lq, P))
+    if np.any(s_min < 0):
+        raise ValueError('El criterio no se cumple con ningún número '
+                         'de servidores en algún periodo.')
+    if s_max is None:
+        s_max = int(s_min.max()) + 10
+    elif s_max < s_min.max():
+        raise ValueError('s_max debe ser al menos {} (servidores mínimos '
+                         'requeridos).'.format(s_min.max()))
+    s = np.arange(1, s_max + 1)
+
+    # Costo de cada periodo y número de servidores
+    # (cargas repetidas se evalúan una sola vez)
+    r_unicos, indice = np.unique(lam_horas / nu, return_inverse=True)
+    fila = np.array([_fila_media(float(r), s_max) for r in r_unicos])[indice]
+    costo = costo_servidor * s + costo_espera * fila
+    costo[s < s_min[:, np.newaxis]] = np.inf
+
+    # Programación dinámica: acumulado[s] del mejor programa que
+    # termina con s servidores y la decisión previa de cada uno
+    cambio = costo_cambio * np.abs(s[:, np.newaxis] - s[np.newaxis, :])
+    acumulado = costo[0]
+    previo = np.zeros(costo.shape, dtype=int)
+    for h in range(1, len(costo)):
+        transicion = acumulado[np.newaxis, :] + cambio
+        previo[h] = np.argmin(transicion, axis=1)
+        acumulado = costo[h] + transicion[s - 1, previo[h]]
+
+    # Reconstruir el programa óptimo
+    k = np.empty(len(costo), dtype=int)
+    k[-1] = np.argmin(acumulado)
+    for h in range(len(costo) - 1, 0, -1):
+        k[h - 1] = previo[h, k[h]]
+
+    periodos = np.arange(len(costo))
+    tabla = pd.DataFrame({'lam': lam_horas, 's_min': s_min, 's': s[k],
+                          'Lq': fila[periodos, k],
+                          'costo': costo[periodos, k]})
+    prog = (tabla, acumulado.min())
+    return prog
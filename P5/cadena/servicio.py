@@ -10,15 +10,90 @@ del tiempo que la fila del sistema está por encima de cierto valor.
 
 """
 import numpy as np
+from scipy import sparse, stats
+
+
+def nacimiento_muerte(nacimientos, muertes):
+    r"""Vector de estado estable de un proceso de nacimiento y muerte.
+
+    Para tasas de nacimiento :math:`\lambda_{0}, ..., \lambda_{n-2}`
+    y de muerte :math:`\mu_{1}, ..., \mu_{n-1}` arbitrarias
+    (cualquier variante M/M/s/K) resuelve las ecuaciones de balance
+
+    .. math:: \phi_{k} = \phi_{0} \prod_{i=0}^{k-1} \frac{\lambda_{i}}{\mu_{i+1}}
+
+    con productos acumulados en escala logarítmica, de modo que no
+    se desborda y el costo es lineal en el número de estados.
+    Si los arreglos tienen más de una dimensión, cada fila
+    (último eje) es un sistema independiente.
+
+    Parameters
+    ----------
+    nacimientos : ndarray
+        Tasas de nacimiento de los estados :math:`0, ..., n - 2`.
+    muertes : ndarray
+        Tasas de muerte de los estados :math:`1, ..., n - 1`.
+
+    Returns
+    -------
+    v_estable : ndarray
+        Vector de estado estable de :math:`n` estados.
+
+    """
+    with np.errstate(divide='ignore'):
+        log_r = np.log(nacimientos) - np.log(muertes)
+
+    # ln(phi_k / phi_0) para k = 0, 1, ..., n - 1
+    forma = np.shape(log_r)[:-1] + (1,)
+    log_phi = np.concatenate((np.zeros(forma), np.cumsum(log_r, axis=-1)),
+                             axis=-1)
+
+    # Normalizar restando el máximo antes de exponenciar
+    phi = np.exp(log_phi - np.max(log_phi, axis=-1, keepdims=True))
+    v_estable = phi / np.sum(phi, axis=-1, keepdims=True)
+    return v_estable
+
+
+def tasas(lam_llegada, nu, s, K):
+    r"""Tasas de nacimiento y muerte de un sistema M/M/s/K.
+
+    Parameters
+    ----------
+    lam_llegada : flotante
+        Parámetro de intensidad de llegadas al sistema.
+    nu : flotante
+        Parámetro de intensidad servicio de cada servidor.
+    s : entero
+        Número de servidores.
+    K : entero
+        Capacidad del sistema (estados :math:`0, ..., K`).
+
+    Returns
+    -------
+    nac_mue : tupla
+        Argumentos para :py:func:`nacimiento_muerte`. Posiciones:
+
+        - [0] Tasas de nacimiento :math:`\lambda` de los estados
+          :math:`0, ..., K - 1`.
+        - [1] Tasas de muerte :math:`\min(k, s)\nu` de los estados
+          :math:`1, ..., K`.
+
+    """
+    k = np.arange(1, K + 1)
+    nac_mue = (np.full(K, lam_llegada, dtype=float),
+               np.minimum(k, s) * nu)
+    return nac_mue
 
 
 def estados(omega, p, q, n):
-    r"""Para ``n`` pequeño, obtiene el vector de estado estable.
+    r"""Para ``n`` estados, obtiene el vector de estado estable.
 
     Se usa la fórmula recursiva con los valores de los
     parámetros :math:`\Omega_{i}` y las probabilidades de transición
     :math:`p_{i}` , :math:`q_{i}` para
     :math:`n = 0, 1, 2, ... i` con :math:`\lvert n \rvert = i + 1` estados definidos.
+    Las tasas de nacimiento :math:`\Omega_{i} p_{i}` y de muerte
+    :math:`\Omega_{i} q_{i}` se resuelven con :py:func:`nacimiento_muerte`.
 
     Parameters
     ----------
@@ -43,29 +118,101 @@ def estados(omega, p, q, n):
         Vector de estado estable (probabilidades de estado estable).
 
     """
-    # Vector de estado estable
-    phi = np.empty(n)
+    omega, p, q = np.asarray(omega), np.asarray(p), np.asarray(q)
 
-    # Estado i = 1
-    phi[1] = (omega[0] * p[0] * 1) / (omega[1] * q[1])
+    # Tasas de nacimiento (estados 0, ..., n - 2)
+    # y de muerte (estados 1, ..., n - 1)
+    nacimientos = omega[..., :n - 1] * p[..., :n - 1]
+    muertes = omega[..., 1:n] * q[..., 1:n]
 
-    # para el resto de estados i = 2, 3, ...
-    for h in range(2, n):
-        phi[h] = (omega[h - 1] * p[h - 1] * phi[h - 1]) / (omega[h] * q[h])
+    v_estable = nacimiento_muerte(nacimientos, muertes)
+    return v_estable
 
-    # Normalizar y despejar phi_i para estado i = 0
-    phi[0] = 1/(1+np.sum(phi[1:]))
 
-    # Definir vector de estado estable
-    v_estable = np.empty(n)
-    # Probabilidad para cada estado
-    for v in range(n):
-        if v == 0:
-            v_estable[v] = phi[0]
-        else:
-            v_estable[v] = phi[0] * phi[v]
+def transitorio(omega, p, q, t, v_inicial=None, tol=1e-10):
+    r"""Probabilidades de estado en el tiempo (régimen transitorio).
 
-    return v_estable
+    Con las tasas de nacimiento :math:`\Omega_{i} p_{i}` y de muerte
+    :math:`\Omega_{i} q_{i}` de :math:`n` estados (ver
+    :py:func:`cadena.analisis.parametros`) arma el generador
+    tridiagonal :math:`Q` como matriz dispersa y resuelve
+    :math:`\pi(t) = \pi(0) e^{Qt}` por uniformización: con
+    :math:`\Lambda = \max_{i} |Q_{ii}|` y :math:`P = I + Q/\Lambda`,
+
+    .. math:: \pi(t) = \sum_{k=0}^{\infty} e^{-\Lambda t}\frac{(\Lambda t)^{k}}{k!} \pi(0) P^{k}
+
+    La serie se trunca cuando la cola de Poisson del mayor tiempo
+    es menor que ``tol`` y cada término :math:`\pi(0) P^{k}` se
+    reutiliza para todos los tiempos a la vez. El último estado
+    no tiene nacimientos (cadena truncada), por lo que :math:`n`
+    debe ser suficientemente grande.
+
+    Parameters
+    ----------
+    omega : vector
+        Parámetros de permanencia de los estados :math:`0, ..., n - 1`.
+    p : vector
+        Probabilidades de transición de :math:`i` a :math:`i + 1`.
+    q : vector
+        Probabilidades de transición de :math:`i` a :math:`i - 1`.
+    t : flotante o vector
+        Instantes de evaluación (mismas unidades que :math:`1/\Omega`).
+    v_inicial : vector, opcional
+        Distribución inicial; por defecto el sistema inicia vacío.
+    tol : flotante
+        Error de truncamiento de la serie.
+
+    Returns
+    -------
+    v_t : ndarray
+        Probabilidades de estado, una fila por instante en ``t``.
+
+    Examples
+    --------
+    >>> from cadena import analisis, servicio
+    >>> import numpy as np
+    >>> omega, p, q = analisis.parametros(lam_llegada, nu, np.arange(200), s=1)
+    >>> # Primeros 10 minutos después de abrir
+    >>> v_t = servicio.transitorio(omega, p, q, np.arange(0, 601, 60))
+    >>> # Clientes promedio en el sistema en cada minuto
+    >>> L_t = v_t @ np.arange(200)
+
+    """
+    omega = np.asarray(omega, dtype=float)
+    n = len(omega)
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+
+    # Generador tridiagonal disperso
+    nacimientos = (omega * np.asarray(p))[:n - 1]
+    muertes = (omega * np.asarray(q))[1:]
+    salida = np.concatenate((nacimientos, [0])) + np.concatenate(([0], muertes))
+    Q = sparse.diags([muertes, -salida, nacimientos], [-1, 0, 1], format='csr')
+
+    # Cadena uniformizada (se usa traspuesta para iterar vectores columna)
+    Lam = salida.max()
+    PT = (sparse.identity(n, format='csr') + Q / Lam).T.tocsr()
+
+    if v_inicial is None:
+        v_k = np.zeros(n)
+        v_k[0] = 1
+    else:
+        v_k = np.asarray(v_inicial, dtype=float)
+
+    # Términos de la serie hasta la cola de Poisson del mayor tiempo,
+    # acumulados por bloques de k como producto de matrices
+    k_max = int(stats.poisson.isf(tol, Lam * t.max())) + 1
+    bloque = 256
+    V = np.empty((bloque, n))
+    v_t = np.zeros((len(t), n))
+    for k0 in range(0, k_max + 1, bloque):
+        m = min(bloque, k_max + 1 - k0)
+        for j in range(m):
+            V[j] = v_k
+            v_k = PT @ v_k
+        pesos = stats.poisson.pmf(np.arange(k0, k0 + m), Lam * t[:, None])
+        v_t += pesos @ V[:m]
+
+    return v_t
 
 
 def probabilidad(lam_llegada, nu, i):
@@ -122,18 +269,23 @@ def fila(lam_llegada, nu):
     la función calcula el porcentaje de clientes que hacen una fila
     de :math:`L_{q}` o más espacios antes de ser atendidos.
 
+    La suma de probabilidades de estado hasta :math:`L - 1`
+    es una serie geométrica, por lo que el porcentaje se
+    obtiene en forma cerrada como :math:`100 \rho^{L}`
+    y admite arreglos de :math:`\lambda` y :math:`\nu`.
+
     Parameters
     ----------
-    lam_llegada : flotante
+    lam_llegada : flotante o ndarray
         Parámetro de intensidad de llegadas al sistema.
-    nu : flotante
+    nu : flotante o ndarray
         Parámetro de intensidad servicio del sistema.
 
     Returns
     -------
-    Lq : entero
+    Lq : entero o ndarray
         Espacios promedio antes de recibir atención.
-    PLq : flotane
+    PLq : flotante o ndarray
         Porcentaje de tiempo en que los clientes que hacen fila
         (cuando todos los servidores están ocupados)
         de al menos :math:`L_{q}` espacios antes de recibir el servicio.
@@ -155,6 +307,8 @@ def fila(lam_llegada, nu):
     al menos 2 espacios antes de ser atendidos.
 
     """
+    lam_llegada = np.asarray(lam_llegada, dtype=float)
+    nu = np.asarray(nu, dtype=float)
     # Promedio clientes en fila cuando el servidor está ocupado
     fila = (pow(lam_llegada, 2)) / ((nu) * (nu - lam_llegada))
     # Obtener entero próximo superior:
@@ -163,16 +317,148 @@ def fila(lam_llegada, nu):
     r = lam_llegada / nu
     # Longitud de cola
     L = np.ceil(Lq / r).astype('int')
-    phi = 0        # Inicializar vector estado estable
-
-    # Operar sumatoria
-    for n in range(L):
-        # Probabilidad de estado: Llamar función anterior
-        # phi_i = pow(lam_llegada/nu, n) * (1 - lam_llegada/nu)
-        phi_i = probabilidad(lam_llegada, nu, n)
-        phi += phi_i
-    # Sacar complemento
-    PLq = 1 - phi
+    # Complemento de la serie geométrica:
+    # 1 - sum_{n=0}^{L-1} r^n (1 - r) = r^L
+    PLq = pow(r, L)
 
     # Retornar porcentaje
-    return (Lq, PLq*100)
+    return (Lq[()], PLq[()]*100)
+
+
+def metricas(lam_llegada, nu):
+    r"""Medidas de desempeño en estado estable del sistema M/M/1.
+
+    Con :math:`\rho = \frac{\lambda}{\nu} < 1` las fórmulas
+    cerradas son
+
+    .. math:: L = \frac{\rho}{1 - \rho}, \quad L_{q} = \frac{\rho^{2}}{1 - \rho}, \quad W = \frac{1}{\nu - \lambda}, \quad W_{q} = \frac{\rho}{\nu - \lambda}
+
+    Los parámetros pueden ser arreglos (se combinan por
+    *broadcasting*) para evaluar muchos niveles de carga a la vez.
+    Si :math:`\rho \geq 1` no existe estado estable y
+    las cuatro medidas son infinitas.
+
+    Parameters
+    ----------
+    lam_llegada : flotante o ndarray
+        Parámetro de intensidad de llegadas al sistema.
+    nu : flotante o ndarray
+        Parámetro de intensidad servicio del sistema.
+
+    Returns
+    -------
+    L : flotante o ndarray
+        Número promedio de clientes en el sistema.
+    Lq : flotante o ndarray
+        Número promedio de clientes en fila.
+    W : flotante o ndarray
+        Tiempo promedio en el sistema.
+    Wq : flotante o ndarray
+        Tiempo promedio de espera en fila.
+
+    Examples
+    --------
+    >>> from cadena import servicio
+    >>> L, Lq, W, Wq = servicio.metricas(0.0350, 0.0488)
+    >>> print('W = {:0.2f} s, Wq = {:0.2f} s'.format(W, Wq))
+    W = 72.46 s, Wq = 51.97 s
+
+    """
+    lam_llegada, nu = np.broadcast_arrays(
+        np.asarray(lam_llegada, dtype=float), np.asarray(nu, dtype=float))
+    rho = lam_llegada / nu
+    estable = rho < 1
+    # Evitar divisiones entre cero en sistemas inestables
+    holgura = np.where(estable, nu - lam_llegada, 1.0)
+
+    L = np.where(estable, lam_llegada / holgura, np.inf)
+    Lq = np.where(estable, rho * lam_llegada / holgura, np.inf)
+    W = np.where(estable, 1 / holgura, np.inf)
+    Wq = np.where(estable, rho / holgura, np.inf)
+
+    return (L[()], Lq[()], W[()], Wq[()])
+
+
+def cola(lam_llegada, nu, k):
+    r"""Probabilidad de que haya :math:`k` o más clientes en el sistema.
+
+    Para el sistema M/M/1 la cola de la distribución geométrica es
+
+    .. math:: P(N \geq k) = \rho^{k}
+
+    vectorizada sobre :math:`\lambda`, :math:`\nu` y :math:`k`.
+
+    Parameters
+    ----------
+    lam_llegada : flotante o ndarray
+        Parámetro de intensidad de llegadas al sistema.
+    nu : flotante o ndarray
+        Parámetro de intensidad servicio del sistema.
+    k : entero o ndarray
+        Número de clientes.
+
+    Returns
+    -------
+    P : flotante o ndarray
+        Probabilidad :math:`P(N \geq k)` (uno si no hay estado estable).
+
+    Examples
+    --------
+    >>> from cadena import servicio
+    >>> print('{:0.4%}'.format(servicio.cola(0.0350, 0.0488, 5)))
+    18.9776%
+
+    """
+    rho = np.minimum(np.asarray(lam_llegada, dtype=float) / nu, 1.0)
+    P = pow(rho, np.asarray(k, dtype=float))
+
+    return P[()]
+
+
+def percentiles(lam_llegada, nu, P):
+    r"""Percentiles del tiempo en el sistema y del tiempo en fila M/M/1.
+
+    El tiempo en el sistema es exponencial con parámetro
+    :math:`\nu - \lambda` y el tiempo en fila tiene un átomo
+    :math:`1 - \rho` en cero, así el percentil :math:`p` es
+
+    .. math:: W_{p} = \frac{-\ln(1 - p)}{\nu - \lambda}, \quad W_{q,p} = \max\left(0, \frac{\ln\frac{\rho}{1 - p}}{\nu - \lambda}\right)
+
+    Parameters
+    ----------
+    lam_llegada : flotante o ndarray
+        Parámetro de intensidad de llegadas al sistema.
+    nu : flotante o ndarray
+        Parámetro de intensidad servicio del sistema.
+    P : flotante o ndarray
+        Porcentaje (entre 0 y 100).
+
+    Returns
+    -------
+    W_p : flotante o ndarray
+        Tiempo en el sistema que no se excede el P% de las veces.
+    Wq_p : flotante o ndarray
+        Tiempo en fila que no se excede el P% de las veces.
+
+    Examples
+    --------
+    >>> from cadena import servicio
+    >>> W_p, Wq_p = servicio.percentiles(0.0350, 0.0488, 90)
+    >>> print('W_90 = {:0.1f} s, Wq_90 = {:0.1f} s'.format(W_p, Wq_p))
+    W_90 = 166.9 s, Wq_90 = 142.8 s
+
+    """
+    p = np.asarray(P, dtype=float) / 100
+    if np.any((p <= 0) | (p >= 1)):
+        raise ValueError('El porcentaje debe estar entre 0 y 100.')
+    lam_llegada, nu, p = np.broadcast_arrays(
+        np.asarray(lam_llegada, dtype=float), np.asarray(nu, dtype=float), p)
+    rho = lam_llegada / nu
+    estable = rho < 1
+    holgura = np.where(estable, nu - lam_llegada, 1.0)
+
+    W_p = np.where(estable, -np.log1p(-p) / holgura, np.inf)
+    Wq_p = np.where(
+        estable, np.maximum(0, np.log(rho / (1 - p)) / holgura), np.inf)
+
+    return (W_p[()], Wq_p[()])
@@ -6,14 +6,357 @@ y la intensidad del servicio que está exponencialmente distribuida,
 se asumen provenientes de una distribución exponencial :math:`\frac{1}{scale}`.
 Luego el sistema en cuestión se trata del
 proceso de Nacimiento y Muerte de un servidor únicamente :math:`s` = 1
+(el motor de eventos admite además :math:`s` servidores, capacidad
+finita y clases de prioridad).
 
 """
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 import numpy as np
+import pandas as pd
 from scipy import stats
 import matplotlib.pyplot as plt
+from . import servicio
 
 
-def sistema(lam_llegada, nu, N):
+def eventos(t_llegadas, t_servicio, s=1, K=None, clases=None):
+    r"""Motor de simulación por eventos discretos de una cola M/M/s/K.
+
+    Recorre las llegadas en orden y mantiene en un montículo (heap)
+    los instantes de salida de los clientes en servicio, de modo
+    que cada evento cuesta :math:`O(\log s)`. Los clientes que
+    encuentran los :math:`s` servidores ocupados esperan en un
+    segundo montículo ordenado por clase de prioridad (menor es
+    más prioritaria) y, dentro de cada clase, por orden de llegada.
+    Los resultados se escriben en arreglos previamente reservados.
+
+    Con un único servidor FIFO sin capacidad ni clases se usa la
+    recursión de Lindley vectorizada (ver :py:func:`lindley`),
+    que procesa decenas de millones de clientes en segundos. Los
+    demás casos recorren los clientes en Python, del orden de
+    1.5 millones de clientes por segundo en fila única FIFO y
+    0.8 millones con capacidad o clases.
+
+    Parameters
+    ----------
+    t_llegadas : vector
+        Instantes de llegada de los clientes (no decrecientes).
+    t_servicio : vector
+        Duración del servicio de cada cliente.
+    s : entero
+        Número de servidores.
+    K : entero, opcional
+        Capacidad del sistema (en servicio más en fila); los clientes
+        que llegan con el sistema lleno son rechazados.
+    clases : vector de enteros, opcional
+        Clase de prioridad de cada cliente.
+
+    Returns
+    -------
+    sim : tupla
+        Arreglos de longitud :math:`N`. Posiciones:
+
+        - [0] instantes en que cada cliente es atendido.
+        - [1] instantes en que cada cliente sale del sistema.
+
+        Los clientes rechazados tienen ``NaN`` en ambos.
+
+    Examples
+    --------
+    >>> from cadena import simulacion
+    >>> import numpy as np
+    >>> t_llegadas = np.array([0, 1, 2, 3, 4.])
+    >>> t_servicio = np.array([5, 5, 1, 1, 1.])
+    >>> clases = np.array([1, 1, 1, 0, 1])
+    >>> atencion, salida = simulacion.eventos(
+    >>>     t_llegadas, t_servicio, s=2, K=4, clases=clases)
+    >>> print(atencion)
+    [ 0.  1.  6.  5. nan]
+
+    """
+    t_llegadas = np.asarray(t_llegadas, dtype=float)
+    t_servicio = np.asarray(t_servicio, dtype=float)
+    if s == 1 and K is None and clases is None:
+        return _lindley(t_llegadas, t_servicio)
+
+    N = len(t_llegadas)
+    t_atencion = np.full(N, np.nan)
+    t_salida = np.full(N, np.nan)
+    llegadas = t_llegadas.tolist()
+    servicios = t_servicio.tolist()
+
+    if K is None and clases is None:
+        # Fila única FIFO: cada cliente toma el servidor que
+        # se libera primero (un montículo de s instantes)
+        libres = [0.0] * s
+        for c in range(N):
+            inicio = max(llegadas[c], libres[0])
+            heapq.heapreplace(libres, inicio + servicios[c])
+            t_atencion[c] = inicio
+        t_salida[:] = t_atencion + t_servicio
+        return (t_atencion, t_salida)
+
+    prioridad = [0] * N if clases is None else list(clases)
+    capacidad = np.inf if K is None else K
+    salidas = []        # Montículo de salidas de clientes en servicio
+    espera = []         # Montículo de (clase, cliente) en fila
+    en_sistema = 0
+    ocupados = 0
+
+    def atender(c, t):
+        t_atencion[c] = t
+        t_salida[c] = t + servicios[c]
+        heapq.heappush(salidas, t_salida[c])
+
+    def salir(t):
+        # Libera un servidor y, si hay fila, atiende al siguiente
+        nonlocal en_sistema, ocupados
+        en_sistema -= 1
+        if espera:
+            atender(heapq.heappop(espera)[1], t)
+        else:
+            ocupados -= 1
+
+    for c in range(N):
+        llegada = llegadas[c]
+        # Procesar salidas ocurridas antes de esta llegada
+        while salidas and salidas[0] <= llegada:
+            salir(heapq.heappop(salidas))
+        if en_sistema >= capacidad:
+            continue
+        en_sistema += 1
+        if ocupados < s:
+            ocupados += 1
+            atender(c, llegada)
+        else:
+            heapq.heappush(espera, (prioridad[c], c))
+
+    # Vaciar el sistema
+    while salidas:
+        salir(heapq.heappop(salidas))
+
+    return (t_atencion, t_salida)
+
+
+def _lindley(t_llegadas, t_servicio):
+    """Instantes de atención y salida de un servidor FIFO sin lazos."""
+    C = np.cumsum(t_servicio)
+    # Máximo acumulado de a_j - C_{j-1}
+    t_salida = C + np.maximum.accumulate(t_llegadas - (C - t_servicio))
+    t_atencion = t_salida - t_servicio
+    return (t_atencion, t_salida)
+
+
+def lindley(lam_llegada, nu, N, semilla=None):
+    r"""Simulación vectorizada de un sistema M/M/1 (recursión de Lindley).
+
+    Con un único servidor FIFO la salida de cada cliente es
+    :math:`d_{i} = \max(a_{i}, d_{i-1}) + S_{i}`. Restando la suma
+    acumulada de servicios :math:`C_{i}` la recursión se vuelve
+    un máximo acumulado,
+
+    .. math:: d_{i} = C_{i} + \max_{j \leq i}\left(a_{j} - C_{j-1}\right)
+
+    que se evalúa con ``np.cumsum`` y ``np.maximum.accumulate``
+    sin lazos y conservando los tiempos en punto flotante.
+
+    Parameters
+    ----------
+    lam_llegada : flotante
+        Parámetro de la intensidad de intervalos de llegadas
+        entre clientes al sistema.
+    nu : flotante
+        Parámetro del tiempo de servicio del sistema.
+    N : entero
+        Número de clientes.
+    semilla : entero o Generator, opcional
+        Semilla del generador de números aleatorios.
+
+    Returns
+    -------
+    sis : tupla
+        Arreglos de longitud :math:`N`. Posiciones:
+
+        - [0] tiempos de llegadas de clientes.
+        - [1] tiempos de servicio de cada cliente.
+        - [2] tiempos en que cada cliente es atentido.
+        - [3] tiempos en que cada cliente sale del sistema.
+
+    Examples
+    --------
+    >>> from cadena import simulacion
+    >>> llegadas, servicio, atencion, salida = simulacion.lindley(
+    >>>     lam_llegada, nu, 10**7, semilla=0)
+    >>> # Espera promedio en fila
+    >>> Wq = (atencion - llegadas).mean()
+
+    """
+    rng = np.random.default_rng(semilla)
+    # Intervalos entre llegadas y tiempos de servicio exponenciales
+    t_intervalos = stats.expon(scale=1 / lam_llegada).rvs(N, random_state=rng)
+    t_servicio = stats.expon(scale=1 / nu).rvs(N, random_state=rng)
+
+    t_llegadas = np.cumsum(t_intervalos)
+    t_atencion, t_salida = _lindley(t_llegadas, t_servicio)
+
+    return (t_llegadas, t_servicio, t_atencion, t_salida)
+
+
+def llegadas_variables(lam_t, ancho, T, semilla=None):
+    r"""Genera llegadas de un proceso de Poisson no homogéneo (adelgazamiento).
+
+    Con la intensidad por intervalos :math:`\lambda(t)` (ver
+    :py:func:`cadena.analisis.llegada_variable`), que se repite
+    periódicamente si ``T`` excede los intervalos dados, genera un
+    proceso homogéneo con :math:`\lambda_{max}` y conserva cada
+    llegada con probabilidad :math:`\frac{\lambda(t)}{\lambda_{max}}`.
+    Todos los candidatos se generan y filtran de forma vectorizada.
+
+    Parameters
+    ----------
+    lam_t : vector
+        Intensidad de llegada en cada intervalo.
+    ancho : flotante
+        Ancho de cada intervalo en segundos.
+    T : flotante
+        Horizonte de simulación en segundos.
+    semilla : entero o Generator, opcional
+        Semilla del generador de números aleatorios.
+
+    Returns
+    -------
+    t_llegadas : ndarray
+        Instantes de llegada ordenados en :math:`[0, T)`.
+
+    Examples
+    --------
+    >>> from cadena import analisis, simulacion
+    >>> inicios, lam_t = analisis.llegada_variable(
+    >>>     'clientes.csv', ancho=3600, periodo=86400)
+    >>> t_llegadas = simulacion.llegadas_variables(lam_t, 3600, 7*86400)
+
+    """
+    rng = np.random.default_rng(semilla)
+    lam_t = np.asarray(lam_t, dtype=float)
+    lam_max = lam_t.max()
+    if lam_max <= 0:
+        return np.empty(0)
+
+    # Candidatos del proceso homogéneo: dado su número son uniformes
+    candidatos = np.sort(rng.uniform(0, T, rng.poisson(lam_max * T)))
+    lam_c = lam_t[(candidatos // ancho).astype(int) % len(lam_t)]
+    t_llegadas = candidatos[rng.uniform(size=len(candidatos)) * lam_max < lam_c]
+    return t_llegadas
+
+
+def _replica(lam_llegada, nu, N, calentamiento, semilla):
+    """Medidas de una réplica M/M/1: (Wq, Lq, utilización)."""
+    llegadas, servicio, atencion, salida = lindley(lam_llegada, nu, N, semilla)
+    # Descartar los clientes del periodo de calentamiento
+    k = int(calentamiento * N)
+    llegadas, servicio, atencion = llegadas[k:], servicio[k:], atencion[k:]
+    espera = atencion - llegadas
+    # Horizonte medido: de la primera llegada conservada a la última salida
+    T = salida[-1] - llegadas[0]
+    # El área bajo la longitud de la fila es la suma de esperas
+    return (espera.mean(), espera.sum() / T, servicio.sum() / T)
+
+
+def replicas(lam_llegada, nu, N, R=100, precision=0.05, confianza=95,
+             lote=10, procesos=None, semilla=None, calentamiento=0.1):
+    r"""Réplicas independientes del sistema M/M/1 con intervalos de confianza.
+
+    Ejecuta hasta :math:`R` réplicas de :py:func:`lindley` de
+    :math:`N` clientes cada una, con semillas independientes
+    derivadas de ``np.random.SeedSequence``, repartidas entre
+    varios procesos en lotes. Tras cada lote calcula el intervalo
+    de confianza (distribución t de Student) de la espera promedio
+    en fila :math:`W_{q}`, la longitud promedio de la fila
+    :math:`L_{q}` y la utilización del servidor, y se detiene
+    cuando el semiancho relativo de las tres es menor que ``precision``.
+
+    Cada réplica arranca con el sistema vacío, así que la primera
+    fracción ``calentamiento`` de sus clientes se descarta antes de
+    medir (eliminación del transitorio inicial). Las réplicas
+    independientes cumplen el papel de los lotes del método de
+    medias por lotes, por lo que no se subdivide cada réplica.
+
+    Parameters
+    ----------
+    lam_llegada : flotante
+        Parámetro de la intensidad de intervalos de llegadas.
+    nu : flotante
+        Parámetro del tiempo de servicio del sistema.
+    N : entero
+        Número de clientes por réplica.
+    R : entero
+        Número máximo de réplicas (al menos 2).
+    precision : flotante
+        Semiancho relativo objetivo (e.g. 0.05 es 5 % de la media).
+    confianza : flotante
+        Nivel de confianza en porcentaje.
+    lote : entero
+        Réplicas por lote entre revisiones de la precisión.
+    procesos : entero
+        Cantidad de procesos en paralelo. ``None`` usa todos
+        los procesadores disponibles y 1 ejecuta en serie.
+    semilla : entero, opcional
+        Semilla raíz de las réplicas.
+    calentamiento : flotante
+        Fracción inicial de clientes de cada réplica que no se
+        mide (:math:`0 \leq` ``calentamiento`` :math:`< 1`).
+
+    Returns
+    -------
+    res : tupla
+        Posiciones:
+
+        - [0] DataFrame con índice ``Wq``, ``Lq`` y ``utilizacion``
+          y columnas ``media``, ``semiancho``, ``inferior`` y ``superior``.
+        - [1] número de réplicas ejecutadas.
+
+    Examples
+    --------
+    >>> from cadena import simulacion
+    >>> tabla, n = simulacion.replicas(lam_llegada, nu, 10**5, semilla=0)
+    >>> print(tabla.round(3))
+
+    """
+    if R < 2:
+        raise ValueError('Se requieren al menos 2 réplicas.')
+    if not 0 <= calentamiento < 1 or int(calentamiento * N) >= N:
+        raise ValueError('calentamiento debe dejar clientes por medir.')
+
+    semillas = np.random.SeedSequence(semilla).spawn(R)
+    muestras = np.empty((R, 3))
+    n = 0
+
+    grupo = nullcontext() if procesos == 1 else ProcessPoolExecutor(procesos)
+    with grupo as ejecutor:
+        mapa = map if ejecutor is None else ejecutor.map
+        while n < R:
+            m = min(lote, R - n)
+            muestras[n:n + m] = list(mapa(
+                _replica, [lam_llegada] * m, [nu] * m, [N] * m,
+                [calentamiento] * m, semillas[n:n + m]))
+            n += m
+            if n < 2:
+                continue
+            media = muestras[:n].mean(axis=0)
+            semiancho = (stats.t.ppf(0.5 + confianza / 200, n - 1)
+                         * muestras[:n].std(axis=0, ddof=1) / np.sqrt(n))
+            if np.all(semiancho <= precision * np.abs(media)):
+                break
+
+    tabla = pd.DataFrame(
+        {'media': media, 'semiancho': semiancho,
+         'inferior': media - semiancho, 'superior': media + semiancho},
+        index=['Wq', 'Lq', 'utilizacion'])
+    return (tabla, n)
+
+
+def sistema(lam_llegada, nu, N, s=1):
     """Simula una secuencia de llegadas y salidas de clientes al sistema.
 
     Para los parámetros de llegada y salida dados, genera una secuencia
@@ -32,6 +375,9 @@ def sistema(lam_llegada, nu, N):
     N : entero
         Número de clientes.
 
+    s : entero
+        Número de servidores (ver :py:func:`eventos`).
+
     Returns
     -------
     sis : tupla
@@ -84,35 +430,183 @@ def sistema(lam_llegada, nu, N):
     # Instantes de llegada y atención
     # -----
 
-    # Instante en que cada cliente llega:
-    # Tiempos de llegada de cada cliente, cuyo primer elemento
-    # es el intervalo de llegada del primer cliente
-    t_llegadas = [t_intervalos[0]]
-
-    # Anexar, mediante lazo for, los instantes (segundos) de llegada
-    # de cada cliente
-    for t in range(1, N):
-        siguiente = t_llegadas[t - 1] + t_intervalos[t]
-        t_llegadas.append(siguiente)
+    # Instante en que cada cliente llega: suma acumulada de intervalos
+    t_llegadas = np.cumsum(t_intervalos)
 
     # Tiempos de atención: Instantes en que cada cliente es atentido
-    inicio = t_llegadas[0]            # primera llegada
-    fin = inicio + t_servicio[0]      # primera salida
-
-    # Lista del conjunto de tiempos de atención.
-    t_atencion = [inicio]
-    for i in range(1, N):
-        inicio = np.max((t_llegadas[i], fin))
-        fin = inicio + t_servicio[i]
-        t_atencion.append(inicio)
+    t_atencion = eventos(t_llegadas, t_servicio, s)[0].astype('int')
 
     # Ordenar la dinámica del sistema
     sis = (t_llegadas, t_servicio, t_atencion)
     return sis
 
 
-def visualizacion(t_llegadas, t_servicio, t_atencion, N):
-    """Gráfica del comportamiento del sistema.
+def ocupacion(t_llegadas, t_servicio, t_atencion, P=5):
+    r"""Proceso de ocupación del sistema a partir de sus eventos.
+
+    Ordena las llegadas (+1) y salidas (-1) de los clientes y
+    con una suma acumulada obtiene el número de clientes
+    :math:`X_{t}` después de cada evento, sin recorrer el tiempo
+    segundo a segundo. Con la duración entre eventos consecutivos
+    se acumula el tiempo que el sistema permanece en cada estado.
+    Los clientes rechazados (``NaN`` en ``t_atencion``) se ignoran.
+
+    Parameters
+    ----------
+    t_llegadas : vector
+        tiempos de llegadas de clientes.
+    t_servicio : vector
+        tiempos de servicio de cada cliente.
+    t_atencion : vector
+        tiempos en que cada cliente es atentido.
+    P : entero
+        Umbral de clientes en el sistema (hay :math:`P - 1` en fila).
+
+    Returns
+    -------
+    ocup : tupla
+        Posiciones:
+
+        - [0] instantes de los eventos (iniciando en cero).
+        - [1] clientes en el sistema a partir de cada instante.
+        - [2] tiempo total en cada estado :math:`n = 0, 1, 2, \cdots`.
+        - [3] fracción del tiempo con :math:`P` o más clientes.
+
+    Examples
+    --------
+    >>> from cadena import simulacion
+    >>> t, Xt, t_estado, fraccion = simulacion.ocupacion(
+    >>>     sistema[0], sistema[1], sistema[2], P=5)
+    >>> print('{:0.2%} del tiempo con 5 o más clientes'.format(fraccion))
+
+    """
+    t_llegadas = np.asarray(t_llegadas, dtype=float)
+    t_atencion = np.asarray(t_atencion, dtype=float)
+    atendidos = ~np.isnan(t_atencion)
+    llegadas = t_llegadas[atendidos]
+    salidas = t_atencion[atendidos] + np.asarray(t_servicio)[atendidos]
+
+    # Eventos ordenados por tiempo; ante empates la salida va primero
+    t = np.concatenate((llegadas, salidas))
+    cambio = np.concatenate((np.ones(len(llegadas), dtype=int),
+                             -np.ones(len(salidas), dtype=int)))
+    orden = np.lexsort((cambio, t))
+    t = np.concatenate(([0.0], t[orden]))
+    Xt = np.concatenate(([0], np.cumsum(cambio[orden])))
+
+    # Tiempo en cada estado hasta la última salida
+    duracion = np.diff(t)
+    t_estado = np.bincount(Xt[:-1], weights=duracion)
+    total = duracion.sum()
+    fraccion = t_estado[P:].sum() / total if total > 0 else 0.0
+
+    ocup = (t, Xt, t_estado, fraccion)
+    return ocup
+
+
+def distribucion(t_llegadas, t_servicio, t_atencion):
+    r"""Distribución empírica del número de clientes en el sistema.
+
+    Cada estado :math:`n` se pondera por el tiempo que el sistema
+    permanece en él (ver :py:func:`ocupacion`), de modo que
+    estima directamente el vector de estado estable :math:`\phi_{n}`.
+
+    Parameters
+    ----------
+    t_llegadas : vector
+        tiempos de llegadas de clientes.
+    t_servicio : vector
+        tiempos de servicio de cada cliente.
+    t_atencion : vector
+        tiempos en que cada cliente es atentido.
+
+    Returns
+    -------
+    v_empirico : ndarray
+        Fracción del tiempo en cada estado :math:`n = 0, 1, 2, \cdots`.
+
+    """
+    t_estado = ocupacion(t_llegadas, t_servicio, t_atencion)[2]
+    v_empirico = t_estado / t_estado.sum()
+    return v_empirico
+
+
+def validacion(t_llegadas, t_servicio, t_atencion, lam_llegada, nu,
+               s=1, K=None):
+    r"""Compara la distribución simulada con la analítica M/M/s/K.
+
+    El vector analítico se obtiene con
+    :py:func:`cadena.servicio.nacimiento_muerte` y las tasas de
+    :py:func:`cadena.servicio.tasas`. Sin capacidad :math:`K` la
+    cadena se trunca donde :math:`\rho^{n}` es despreciable,
+    con :math:`\rho = \frac{\lambda}{s\nu} < 1`.
+    Se reporta la distancia de variación total
+
+    .. math:: d_{TV} = \frac{1}{2}\sum_{n} |\hat{\phi}_{n} - \phi_{n}|
+
+    y el máximo error absoluto entre ambos vectores.
+
+    Parameters
+    ----------
+    t_llegadas : vector
+        tiempos de llegadas de clientes.
+    t_servicio : vector
+        tiempos de servicio de cada cliente.
+    t_atencion : vector
+        tiempos en que cada cliente es atentido.
+    lam_llegada : flotante
+        Parámetro de intensidad de llegadas al sistema.
+    nu : flotante
+        Parámetro de intensidad servicio de cada servidor.
+    s : entero
+        Número de servidores.
+    K : entero, opcional
+        Capacidad del sistema.
+
+    Returns
+    -------
+    reporte : tupla
+        Posiciones:
+
+        - [0] DataFrame por estado con columnas ``empirica``,
+          ``analitica`` y ``error``.
+        - [1] distancia de variación total.
+        - [2] máximo error absoluto.
+
+    Examples
+    --------
+    >>> from cadena import simulacion
+    >>> llegadas, servicio, atencion, salida = simulacion.lindley(
+    >>>     lam_llegada, nu, 10**6, semilla=0)
+    >>> tabla, d_tv, error = simulacion.validacion(
+    >>>     llegadas, servicio, atencion, lam_llegada, nu)
+    >>> print('d_TV = {:0.4f}, error máximo = {:0.4f}'.format(d_tv, error))
+
+    """
+    v_empirico = distribucion(t_llegadas, t_servicio, t_atencion)
+    if K is None:
+        rho = lam_llegada / (s * nu)
+        if rho >= 1:
+            raise ValueError('Sin capacidad finita se requiere lambda < s*nu.')
+        K = max(len(v_empirico) - 1,
+                s + int(np.ceil(np.log(1e-15) / np.log(rho))))
+    else:
+        K = max(len(v_empirico) - 1, K)
+
+    v_analitico = servicio.nacimiento_muerte(
+        *servicio.tasas(lam_llegada, nu, s, K))
+    v_empirico = np.pad(v_empirico, (0, K + 1 - len(v_empirico)))
+    error = v_empirico - v_analitico
+
+    tabla = pd.DataFrame({'empirica': v_empirico, 'analitica': v_analitico,
+                          'error': error})
+    tabla.index.name = 'estado'
+    reporte = (tabla, 0.5 * np.abs(error).sum(), np.abs(error).max())
+    return reporte
+
+
+def visualizacion(t_llegadas, t_servicio, t_atencion, N, P=5):
+    r"""Gráfica del comportamiento del sistema.
 
     Para los parámetros de llegada y salida dados, crea una gráfica para
     observar un ejemplo del comportamiento del sistema.
@@ -127,11 +621,16 @@ def visualizacion(t_llegadas, t_servicio, t_atencion, N):
         tiempos en que cada cliente es atentido.
     N : entero
         Número de clientes
+    P : entero
+        Umbral de clientes en el sistema (ver :py:func:`ocupacion`).
 
     Returns
     -------
-    plot : objeto de pyplot
-        Dinámica (respuestas) del sistema.
+    estad : tupla
+        Además de graficar la dinámica (respuestas) del sistema. Posiciones:
+
+        - [0] tiempo total en cada estado :math:`n = 0, 1, 2, \cdots`.
+        - [1] fracción del tiempo con :math:`P` o más clientes.
 
     Examples
     --------
@@ -141,48 +640,20 @@ def visualizacion(t_llegadas, t_servicio, t_atencion, N):
     >>> # Número de clientes
     >>> N = len(clientes)
     >>> # Graficar: Con los datos obtenidos en cadena.simulacion.sistema()
-    >>> simulacion.visualizacion(sistema[0], sistema[1], sistema[2], N)
+    >>> t_estado, fraccion = simulacion.visualizacion(
+    >>>     sistema[0], sistema[1], sistema[2], N)
     >>> # Ver gráfica en la sección de resultados
 
     """
-    duracion = t_atencion[-1] + t_servicio[-1] + 1
-    t = np.zeros(duracion)
+    t, Xt, t_estado, fraccion = ocupacion(
+        t_llegadas[:N], t_servicio[:N], t_atencion[:N], P)
 
-    # Recorrer cada cliente a lo largo de lo que dura el sistema
-    for c in range(N):
-        # Nacimiento: Llegada c-ésimo cliente
-        i = t_llegadas[c]
-        t[i] += 1
-        # Muerte: Salida c-ésimo cliente
-        j = t_atencion[c] + t_servicio[c]
-        t[j] -= 1
-
-    # Umbral de P o más personas en sistema (hay P - 1 en fila)
-    P = 5
-
-    # Instantes de tiempo con P o más solicitudes en sistema
-    exceso = 0
-
-    # Proceso aleatorio (estados n = {0, 1, 2, ...})
-    Xt = np.zeros(t.shape)
-
-    # Inicialización de estados n
-    n = 0
-
-    # Recorrido del vector temporal y conteo de clientes (estado n)
-    for i, c in enumerate(t):
-        n += c    # sumar (+1) o restar (-1) al estado
-        Xt[i] = n
-        if Xt[i] >= P:
-            exceso += 1
-
-    # # Fracción de tiempo con P o más solicitudes en sistema
-    # fraccion = exceso / len(t)
-
-    plt.plot(Xt)
+    plt.step(t, Xt, where='post')
     plt.xlabel('Tiempo (s)')
     plt.ylabel('Clientes en el sistema, n')
     # Guardar figura
     # plt.savefig('figs/respuesta.svg')
-    # Retornar gráfica
-    return plt.show()
+    plt.show()
+
+    # Retornar estadísticas de ocupación
+    return (t_estado, fraccion)
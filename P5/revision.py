@@ -16,47 +16,32 @@ tiene un tiempo de servicio exponencial con parámetro :math:`\nu`.
 
 """
 
-from cadena import analisis, simulacion, servicio, dimensionamiento
+from cadena import analisis, simulacion, servicio, dimensionamiento, barrido
+import time
 import numpy as np
-import pandas as pd
 
 # -----
 # SECCIÓN A: Analisis
 # -----
 
-# Importar datos
-clientes = pd.read_csv('clientes.csv')
+# Importar datos en bloques: medias, varianzas y diagnóstico
+# exponencial (coeficiente de variación) en memoria constante
+lam_llegada, nu, estad = analisis.estimacion_flujo('clientes.csv')
+print(estad)
 
 # Número de clientes
-N = len(clientes)
+N = int(estad['n'].iloc[0])
 
-# Determinar media de tiempo de llegada entre clientes
-media_lam = clientes["intervalo"].mean()
-
-# Determinar media de servicio a partir de los datos
-media_nu = clientes["servicio"].mean()
-
-# Parámetro de intervalo de llegada
-lam_llegada = analisis.llegada(media_lam)
-
-# Parámetro de servicio
-nu = analisis.servicio(media_nu)
+# Intensidad de llegada por hora (Poisson no homogéneo)
+inicios, lam_t = analisis.llegada_variable('clientes.csv', ancho=3600)
+print('Intensidad de llegada por hora: ', np.round(lam_t, 4))
 
 # Parámetros de los primeros seis estados
 i = 5        # Estado del sistema al tiempo t
 n = i + 1    # Número total de estados hasta instante t
-# Arreglo de los tres parámetros
-parmtrs = np.empty((n, 3))
-# Para cada estado solicitado y sistema M/M/1
-for c in range(n):
-    parmtrs[c, :] = analisis.parametros(lam_llegada, nu, c, s=1)
-
-# Extraer vectores de parámetros encontrados:
-# Parámetro de permanencia
-omega = parmtrs[:, 0]
-# Probabilidades de transición
-p = parmtrs[:, 1]
-q = parmtrs[:, 2]
+# Para todos los estados solicitados y sistema M/M/1 a la vez:
+# Parámetro de permanencia y probabilidades de transición
+omega, p, q = analisis.parametros(lam_llegada, nu, np.arange(n), s=1)
 
 # Mostrar resultados:
 print('Parámetro de intensidad de llegada: {:0.4f}'.format(lam_llegada))
@@ -74,7 +59,51 @@ print('q: ', q)
 sistema = simulacion.sistema(lam_llegada, nu, N)
 
 # Graficar:
-simulacion.visualizacion(sistema[0], sistema[1], sistema[2], N)
+t_estado, fraccion = simulacion.visualizacion(
+    sistema[0], sistema[1], sistema[2], N)
+print('Fracción del tiempo con 5 o más clientes: {:0.2%}'.format(fraccion))
+
+# Llegadas no homogéneas por adelgazamiento con el perfil por hora
+t_variables = simulacion.llegadas_variables(
+    lam_t, 3600, len(lam_t) * 3600, semilla=0)
+print('Llegadas generadas con lambda(t): {}'.format(len(t_variables)))
+
+# Motor de eventos: 3 servidores, capacidad 10 y dos clases de prioridad
+rechazo = simulacion.eventos(
+    sistema[0], sistema[1] * 3, s=3, K=10,
+    clases=np.random.default_rng(0).integers(0, 2, N))[0]
+print('Clientes rechazados (M/M/3/10): {}'.format(np.isnan(rechazo).sum()))
+
+# Ruta rápida M/M/1 (recursión de Lindley) contra el lazo por cliente
+n_bench = 10**6
+inicio = time.perf_counter()
+llegadas, servicios, atencion, salidas = simulacion.lindley(
+    lam_llegada, nu, n_bench, semilla=0)
+t_lindley = time.perf_counter() - inicio
+
+inicio = time.perf_counter()
+atencion_lazo = np.empty(n_bench)
+fin = 0.0
+for c in range(n_bench):
+    atencion_lazo[c] = max(llegadas[c], fin)
+    fin = atencion_lazo[c] + servicios[c]
+t_lazo = time.perf_counter() - inicio
+
+print('Lindley: {:0.3f} s, lazo: {:0.3f} s ({:0.0f}x), diferencia máx.: {:0.2e} s'.format(
+    t_lindley, t_lazo, t_lazo / t_lindley, np.abs(atencion - atencion_lazo).max()))
+print('Wq simulado: {:0.2f} s'.format((atencion - llegadas).mean()))
+
+# Validación: distribución empírica ponderada por tiempo contra servicio
+tabla_val, d_tv, error_max = simulacion.validacion(
+    llegadas, servicios, atencion, lam_llegada, nu)
+print('Variación total: {:0.4f}, error máximo: {:0.4f}'.format(d_tv, error_max))
+
+# Réplicas independientes con intervalos de confianza al 95 %
+# (procesos=1 ejecuta en serie; None reparte entre todos los procesadores)
+tabla_replicas, n_replicas = simulacion.replicas(
+    lam_llegada, nu, 10**5, precision=0.02, semilla=0, procesos=1)
+print('Réplicas ejecutadas: {}'.format(n_replicas))
+print(tabla_replicas.round(4))
 
 # -----
 # SECCIÓN C: Servicio
@@ -95,6 +124,27 @@ print(
     ('esperan en fila, en general,\n'),
     ('al menos {} espacios antes de ser atendidos.'.format(Lq[0])))
 
+# Medidas de desempeño M/M/1 en forma cerrada
+L_sis, Lq_sis, W, Wq = servicio.metricas(lam_llegada, nu)
+W_90, Wq_90 = servicio.percentiles(lam_llegada, nu, 90)
+print('L = {:0.4f}, Lq = {:0.4f}, W = {:0.2f} s, Wq = {:0.2f} s'.format(
+    L_sis, Lq_sis, W, Wq))
+print('P(N >= 5) = {:0.4%}; percentil 90: W = {:0.1f} s, Wq = {:0.1f} s'.format(
+    servicio.cola(lam_llegada, nu, 5), W_90, Wq_90))
+# Barrido de miles de niveles de carga a la vez
+cargas = np.linspace(0.01, 0.99, 5000) * nu
+L_cargas = servicio.metricas(cargas, nu)[0]
+print('Con rho = 0.99 hay en promedio {:0.1f} clientes en el sistema.'.format(
+    L_cargas[-1]))
+
+# Régimen transitorio: primeros 10 minutos después de abrir (sistema vacío)
+n_trans = 200
+omega_t, p_t, q_t = analisis.parametros(lam_llegada, nu, np.arange(n_trans), s=1)
+minutos = np.arange(0, 11)
+v_t = servicio.transitorio(omega_t, p_t, q_t, 60 * minutos)
+for m, L_m in zip(minutos, v_t @ np.arange(n_trans)):
+    print('Minuto {:2d}: {:0.3f} clientes en el sistema'.format(m, L_m))
+
 # -----
 # SECCIÓN D: Dimensionamiento
 # -----
@@ -127,3 +177,15 @@ else:
     print(
         ('Si se cuenta con {} servidores unicamente, cada\n'.format(s)),
         ('servidor debería tardar {} seg. en asistir algún cliente.'.format(t)))
+
+# Barrido de escenarios (equivalente a ``python -m cadena.barrido``)
+escenarios = barrido.barrido(
+    lam_llegada * np.linspace(0.5, 1.2, 8), [nu], [1, 5], [95, 99],
+    np.arange(1, 6))
+print(escenarios.head(10))
+
+# Programación de servidores de costo mínimo con el perfil por hora
+programa, costo_total = dimensionamiento.programacion(
+    lam_t, nu, Lq, P, costo_servidor=10, costo_espera=25, costo_cambio=5)
+print(programa)
+print('Costo total de la jornada: {:0.2f}'.format(costo_total))
@@ -13,4 +13,8 @@ setup(
         'pandas',
         'matplotlib',
     ],
+    extras_require={
+        # Salida .parquet de python -m cadena.barrido
+        'parquet': ['pyarrow'],
+    },
 )
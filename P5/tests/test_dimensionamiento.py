@@ -0,0 +1,31 @@
+"""Pruebas del módulo cadena.dimensionamiento."""
+import warnings
+import numpy as np
+import pytest
+from cadena import dimensionamiento
+
+
+def test_erlang_sin_desborde():
+    """Carga pequeña con cientos de servidores sin advertencias."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        B = dimensionamiento.erlang_b(0.01, 200)
+        C = dimensionamiento.erlang_c(0.01, 200)
+    assert np.isfinite(B) and 0 <= B <= 1
+    assert np.isfinite(C) and 0 <= C <= 1
+
+
+def test_erlang_b_recursion():
+    """Coincide con la fórmula cerrada para pocos servidores."""
+    r, s = 2.5, 4
+    k = np.arange(s + 1)
+    terminos = r**k / np.cumprod(np.concatenate(([1], k[1:])))
+    assert np.isclose(dimensionamiento.erlang_b(r, s),
+                      terminos[-1] / terminos.sum())
+
+
+def test_programacion_s_max_insuficiente():
+    """s_max menor que algún mínimo requerido es un error."""
+    with pytest.raises(ValueError):
+        dimensionamiento.programacion([0.03, 0.05], 0.05, 1, 0.9, 1, 1,
+                                      s_max=1)
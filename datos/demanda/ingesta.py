@@ -0,0 +1,219 @@
+"""Éste módulo obtiene, ordena y almacena los datos de demanda de potencia.
+
+Los proyectos ``consumo`` (P3) y ``proceso`` (P4) analizan el
+consumo de potencia [MW] del Sistema Eléctrico Nacional (SEN)
+publicado por el CENCE, ya sea desde su servicio web (API) o
+desde un archivo ``.json`` descargado previamente. Éste módulo
+concentra en un solo lugar la solicitud, la lectura, la memoria
+caché y el reordenamiento de esos datos en una matriz de
+tamaño (dias, 24) con una fila por día y una columna por hora,
+de modo que ambos paquetes parten del mismo arreglo. Tanto los
+registros como la matriz de cada fuente (periodo solicitado o
+archivo) se calculan una única vez por sesión.
+
+"""
+from functools import lru_cache
+import json
+import os
+import numpy as np
+import pandas as pd
+import requests
+
+# Servicio web del CENCE con la curva de demanda
+URL = "https://apps.grupoice.com/CenceWeb/data/sen/json/DemandaMW"
+
+# Formato de la llave 'fechaHora' de cada registro
+FORMATO = "%Y-%m-%d %H:%M:%S.%f"
+
+
+@lru_cache(maxsize=None)
+def _solicitud(inicio, fin):
+    """Registros del servicio web para un periodo (memoizada)."""
+    r = requests.get(URL, {"inicio": inicio, "fin": fin})
+    r.raise_for_status()
+    return pd.DataFrame(r.json()['data'])
+
+
+@lru_cache(maxsize=None)
+def _archivo(ruta, modificado):
+    """Registros de un archivo .json (memoizada por fecha de modificación)."""
+    with open(ruta, mode='r') as f:
+        return pd.DataFrame(json.load(f)['data'])
+
+
+def _registros(fuente):
+    """Registros en memoria de una fuente ('solicitud' o 'archivo')."""
+    tipo, *llave = fuente
+    return _solicitud(*llave) if tipo == 'solicitud' else _archivo(*llave)
+
+
+def _pivote(df):
+    """Matriz (dias, 24) de los días completos iniciales (sólo lectura)."""
+    dia, hora = _posiciones(df)
+    pw_dia = np.full((dia.max() + 1, 24), np.nan)
+    pw_dia[dia, hora] = df['MW'].to_numpy(dtype=float)
+
+    # Días completos
+    completos = ~np.isnan(pw_dia).any(axis=1)
+    n = len(completos) if completos.all() else np.argmin(completos)
+    pw_dia = pw_dia[:n]
+    pw_dia.flags.writeable = False
+    return pw_dia
+
+
+def _fuente(df):
+    """Fuente de un DataFrame con todos sus registros (o None)."""
+    if len(df) == df.attrs.get('registros'):
+        return df.attrs.get('fuente')
+    return None
+
+
+@lru_cache(maxsize=None)
+def _matriz(fuente):
+    """Matriz de una fuente, ordenada una única vez (memoizada)."""
+    return _pivote(_registros(fuente))
+
+
+def solicitar(inicio, fin):
+    """Solicita los datos de potencia [MW] al servicio web del CENCE.
+
+    Las respuestas se guardan en memoria, de modo que solicitar
+    de nuevo el mismo periodo no repite la consulta. El DataFrame
+    retornado es una copia superficial de la respuesta almacenada
+    (con *Copy-on-Write* de pandas sus modificaciones no alteran
+    la memoria caché) y recuerda su fuente en ``df.attrs``.
+
+    Parameters
+    ----------
+    inicio : cadena
+        *e.g.* 20190101.
+    fin : cadena
+        *e.g.* 20200101.
+
+    Returns
+    -------
+    df : DataFrame
+        Registros en orden secuencial (0, 1, ..., 23, 0, 1, ...)
+        con columnas ``fechaHora`` y ``MW`` entre otras.
+
+    """
+    fuente = ('solicitud', str(inicio), str(fin))
+    df = _registros(fuente).copy(deep=False)
+    df.attrs = {'fuente': fuente, 'registros': len(df)}
+    return df
+
+
+def leer(ruta):
+    """Importa los datos de potencia [MW] de un archivo ``.json``.
+
+    El contenido se guarda en memoria mientras el archivo
+    no sea modificado. Como en :py:func:`solicitar`, se retorna
+    una copia superficial que recuerda su fuente en ``df.attrs``.
+
+    Parameters
+    ----------
+    ruta : cadena
+        Ruta del archivo con la respuesta del servicio web.
+
+    Returns
+    -------
+    df : DataFrame
+        Registros en orden secuencial (0, 1, ..., 23, 0, 1, ...)
+        con columnas ``fechaHora`` y ``MW`` entre otras.
+
+    """
+    ruta = os.path.abspath(ruta)
+    fuente = ('archivo', ruta, os.path.getmtime(ruta))
+    df = _registros(fuente).copy(deep=False)
+    df.attrs = {'fuente': fuente, 'registros': len(df)}
+    return df
+
+
+def _posiciones(df):
+    """Día (desde el primero) y hora de cada registro."""
+    fechas = pd.to_datetime(df['fechaHora'], format=FORMATO)
+    dia = (fechas - fechas.min().normalize()) // pd.Timedelta(days=1)
+    return dia.to_numpy(), fechas.dt.hour.to_numpy()
+
+
+def matriz(df, dias=None):
+    """Ordena los registros en una matriz (dias, 24).
+
+    Cada registro se ubica por su fecha y hora, sin importar el
+    orden del DataFrame (secuencial u ordenado por hora).
+    Sin ``dias`` se retornan todos los días completos. Para los
+    DataFrames de :py:func:`solicitar`, :py:func:`leer` y
+    :py:func:`por_hora` la matriz de su fuente se ordena una única
+    vez y las llamadas siguientes sólo toman una porción de ella,
+    siempre que el DataFrame conserve todos sus registros; si se
+    filtró (e.g. ``df[df.MW > x]``) se ordenan sus propios registros.
+    Para ordenar registros modificados sin cambiar su cantidad se
+    debe descartar la fuente con ``df.attrs.pop('fuente')``.
+
+    Parameters
+    ----------
+    df : DataFrame
+        Registros con columnas ``fechaHora`` y ``MW``.
+    dias : entero, opcional
+        Cantidad de días desde el primero.
+
+    Returns
+    -------
+    pw_dia : ndarray
+        Consumo de potencia, una fila por día y una columna por hora
+        (sólo lectura; usar ``.copy()`` para modificarla).
+
+    Examples
+    --------
+    >>> from demanda import ingesta
+    >>> df = ingesta.leer('demandaMW_2019.json')
+    >>> pw_dia = ingesta.matriz(df)
+    >>> pw_dia.shape
+    (365, 24)
+
+    """
+    fuente = _fuente(df)
+    if fuente is None:
+        pw_dia = _pivote(df)
+        n = len(pw_dia)
+    else:
+        # Días completos (acotados por la selección de por_hora())
+        pw_dia = _matriz(fuente)
+        n = min(len(pw_dia), df.attrs.get('dias', len(pw_dia)))
+    if dias is None:
+        dias = n
+    elif dias > n:
+        raise ValueError('Solo hay {} días completos.'.format(n))
+    return pw_dia[:dias]
+
+
+def por_hora(df, dias):
+    """Registros de los primeros ``dias`` días ordenados por hora.
+
+    Es el orden (todas las 00:00, luego todas las 01:00, ...)
+    que esperan ``consumo.solicitud`` y ``proceso.proceso``.
+
+    Parameters
+    ----------
+    df : DataFrame
+        Registros con columna ``fechaHora``.
+    dias : entero
+        Cantidad de días desde el primero.
+
+    Returns
+    -------
+    df_hr : DataFrame
+        Registros ordenados por hora y luego por día.
+
+    """
+    dia, hora = _posiciones(df)
+    seleccion = np.flatnonzero(dia < dias)
+    orden = seleccion[np.lexsort((dia[seleccion], hora[seleccion]))]
+    df_hr = df.iloc[orden].reset_index(drop=True)
+    # Conserva la fuente para reutilizar su matriz en matriz()
+    if _fuente(df) is None:
+        df_hr.attrs = {}
+    else:
+        df_hr.attrs = dict(df.attrs, registros=len(df_hr),
+                           dias=min(dias, df.attrs.get('dias', dias)))
+    return df_hr
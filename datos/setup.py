@@ -0,0 +1,15 @@
+from setuptools import find_packages, setup
+
+setup(
+    name='demanda',
+    packages=find_packages(include=['demanda']),
+    version='0.0.1',
+    description='Acceso común a los datos de demanda de potencia del SEN (P3 y P4) - IE0405',
+    author='Mario R. Peralta A.',
+    license='MIT',
+    install_requires=[
+        'numpy',
+        'pandas',
+        'requests',
+    ],
+)